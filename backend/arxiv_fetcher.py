@@ -1,25 +1,242 @@
 import arxiv
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+import asyncio
+import functools
+import httpx
+import json
+import re
+import threading
+import time
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional
+from http_client import get_http_client
+from datetime import datetime, timedelta, timezone
+from lxml import etree
+
+# arXiv export API endpoint queried directly by both fetch paths
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+
+# Precompiled XPath queries for the Atom feed the export API returns
+ATOM_NAMESPACES = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+_xpath = functools.partial(etree.XPath, namespaces=ATOM_NAMESPACES)
+ENTRIES_XPATH = _xpath("//atom:entry")
+ID_XPATH = _xpath("string(atom:id)")
+TITLE_XPATH = _xpath("string(atom:title)")
+SUMMARY_XPATH = _xpath("string(atom:summary)")
+PUBLISHED_XPATH = _xpath("string(atom:published)")
+UPDATED_XPATH = _xpath("string(atom:updated)")
+AUTHORS_XPATH = _xpath("atom:author/atom:name/text()")
+PRIMARY_CATEGORY_XPATH = _xpath("string(arxiv:primary_category/@term)")
+CATEGORIES_XPATH = _xpath("atom:category/@term")
+LINKS_XPATH = _xpath("atom:link")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# arXiv publishes new listings once a day, so cached query results stay valid for 24h
+CACHE_DIR = Path(".cache") / "arxiv"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Recent query results are also kept in memory, so repeated runs within a few
+# minutes skip re-reading and re-parsing the JSON cache file
+MEMORY_CACHE_TTL_SECONDS = 5 * 60
+MEMORY_CACHE_MAX_ENTRIES = 256
+_memory_cache: Dict[str, tuple] = {}
+_memory_cache_lock = threading.Lock()  # The async fetch path loads and stores from worker threads
+
+# arXiv categories of interest, mapped to their display names
+CATEGORIES = types.MappingProxyType({
+    "cs.LG": "Machine Learning",
+    "cs.CL": "Natural Language Processing",
+    "cs.CV": "Computer Vision",
+    "stat.ML": "Statistical ML",
+    "quant-ph": "Quantum Physics",
+    "nucl-th": "Nuclear Theory",
+    "nucl-ex": "Nuclear Experiment",
+    "cond-mat.mtrl-sci": "Materials Science",
+    "astro-ph.GA": "Galaxy Astrophysics",
+    "q-bio.NC": "Neurons & Cognition",
+    "cs.CR": "Crypto & Security"
+})
+
+@dataclass(slots=True)
+class PaperRecord:
+    """Flat view of an arxiv.Result with the fields the pipeline reads."""
+    entry_id: str
+    title: str
+    summary: str
+    author_names: str
+    published: Optional[datetime]
+    primary_category: str
+    categories: List[str]
+    pdf_url: Optional[str]
+
+def to_paper_record(paper: arxiv.Result) -> PaperRecord:
+    """Convert a fetched paper once so downstream code doesn't re-join authors."""
+    return PaperRecord(
+        entry_id=paper.entry_id,
+        title=paper.title,
+        summary=paper.summary,
+        author_names=", ".join(author.name for author in paper.authors),
+        published=getattr(paper, "published", None),
+        primary_category=paper.primary_category,
+        categories=list(paper.categories),
+        pdf_url=paper.pdf_url
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_sync_http() -> httpx.Client:
+    """Process-wide client for the blocking fetch path so repeated fetchers reuse its pool."""
+    return httpx.Client(timeout=30, follow_redirects=True)
+
+def _parse_atom_timestamp(value: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+def parse_arxiv_feed(body: bytes) -> List[arxiv.Result]:
+    """Parse an arXiv export API Atom response into arxiv.Result objects with lxml."""
+    papers = []
+    for entry in ENTRIES_XPATH(etree.fromstring(body)):
+        entry_id = ID_XPATH(entry)
+        # The API reports errors as a single entry without a published date
+        published = _parse_atom_timestamp(PUBLISHED_XPATH(entry))
+        if not entry_id or published is None:
+            continue
+        papers.append(arxiv.Result(
+            entry_id=entry_id,
+            updated=_parse_atom_timestamp(UPDATED_XPATH(entry)),
+            published=published,
+            title=WHITESPACE_RE.sub(" ", TITLE_XPATH(entry) or "0"),
+            authors=[arxiv.Result.Author(name) for name in AUTHORS_XPATH(entry)],
+            summary=SUMMARY_XPATH(entry),
+            primary_category=PRIMARY_CATEGORY_XPATH(entry),
+            categories=list(CATEGORIES_XPATH(entry)),
+            links=[
+                arxiv.Result.Link(link.get("href"), title=link.get("title"), rel=link.get("rel"), content_type=link.get("type"))
+                for link in LINKS_XPATH(entry)
+            ]
+        ))
+    return papers
+
+def _cache_key(category: str, max_results: int, days_back: int) -> str:
+    """Build the daily cache key for a category query, on the same UTC day as _date_query."""
+    today = datetime.now(timezone.utc).date()
+    return f"{category}:{today.isoformat()}:{max_results}:{days_back}"
+
+def _serialize_paper(paper: arxiv.Result) -> Dict[str, Any]:
+    """Keep only the fields the pipeline needs so the cache stays plain JSON."""
+    return {
+        "entry_id": paper.entry_id,
+        "title": paper.title,
+        "summary": paper.summary,
+        "authors": [author.name for author in paper.authors],
+        "published": paper.published.isoformat(),
+        "primary_category": paper.primary_category,
+        "categories": paper.categories,
+        "pdf_url": paper.pdf_url
+    }
+
+def _deserialize_paper(data: Dict[str, Any]) -> arxiv.Result:
+    """Rebuild an arxiv.Result from its cached representation."""
+    links = [arxiv.Result.Link(data["pdf_url"], title="pdf")] if data.get("pdf_url") else []
+    return arxiv.Result(
+        entry_id=data["entry_id"],
+        published=datetime.fromisoformat(data["published"]),
+        title=data["title"],
+        authors=[arxiv.Result.Author(name) for name in data["authors"]],
+        summary=data["summary"],
+        primary_category=data["primary_category"],
+        categories=data.get("categories", []),
+        links=links
+    )
+
+def _date_query(category: str, days_back: int) -> str:
+    """Build a search query that lets arXiv apply the submission date window itself."""
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days_back)
+    return f"cat:{category} AND submittedDate:[{cutoff.strftime('%Y%m%d%H%M')} TO {now.strftime('%Y%m%d%H%M')}]"
+
+def _search_params(category: str, max_results: int, days_back: int) -> Dict[str, Any]:
+    return {
+        "search_query": _date_query(category, days_back),
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+        "max_results": max_results
+    }
+
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / f"{key.replace(':', '_')}.json"
+
+def _load_cached(key: str):
+    """Return the cached papers for key, or None on a miss or expired entry."""
+    entry = _memory_cache.get(key)
+    if entry is not None and entry[0] >= time.monotonic():
+        return entry[1]
+    
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as cache_file:
+            papers = [_deserialize_paper(item) for item in json.load(cache_file)]
+    except (OSError, ValueError, KeyError):
+        return None
+    _remember(key, papers)
+    return papers
+
+def _remember(key: str, papers: List[arxiv.Result]) -> None:
+    """Keep papers in the in-memory cache for MEMORY_CACHE_TTL_SECONDS."""
+    with _memory_cache_lock:
+        if key not in _memory_cache and len(_memory_cache) >= MEMORY_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            _memory_cache.pop(next(iter(_memory_cache)))
+        _memory_cache[key] = (time.monotonic() + MEMORY_CACHE_TTL_SECONDS, papers)
+
+def _prune_expired() -> None:
+    """Delete cache files past CACHE_TTL_SECONDS; each day's keys are new files."""
+    cutoff = time.time() - CACHE_TTL_SECONDS
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            # Already removed by a concurrent store
+            pass
+
+def _store_cached(key: str, papers: List[arxiv.Result]) -> None:
+    """Persist papers under key; failures only cost us the cache hit."""
+    _remember(key, papers)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_path(key), "w", encoding="utf-8") as cache_file:
+            json.dump([_serialize_paper(paper) for paper in papers], cache_file)
+    except OSError as e:
+        print(f"Error writing arXiv cache for {key}: {str(e)}")
+    _prune_expired()
+
+def daily_cache(func):
+    """Memoize a category query on disk for the rest of the day."""
+    @functools.wraps(func)
+    def wrapper(self, category: str, max_results: int = 5, days_back: int = 7):
+        key = _cache_key(category, max_results, days_back)
+        cached = _load_cached(key)
+        if cached is not None:
+            print(f"  Using cached papers for {category} ({len(cached)} papers)")
+            return cached
+        
+        papers = func(self, category, max_results, days_back)
+        # Empty results usually mean an error occurred, so don't pin them for a day
+        if papers:
+            _store_cached(key, papers)
+        return papers
+    return wrapper
 
 class ArxivFetcher:
-    def __init__(self):
-        """Initialize the ArXiv categories."""
-        # Define arXiv categories of interest
-        self.categories = {
-            "cs.LG": "Machine Learning",
-            "cs.CL": "Natural Language Processing",
-            "cs.CV": "Computer Vision",
-            "stat.ML": "Statistical ML",
-            "quant-ph": "Quantum Physics",
-            "nucl-th": "Nuclear Theory",
-            "nucl-ex": "Nuclear Experiment",
-            "cond-mat.mtrl-sci": "Materials Science",
-            "astro-ph.GA": "Galaxy Astrophysics",
-            "q-bio.NC": "Neurons & Cognition",
-            "cs.CR": "Crypto & Security"
-        }
+    # Shared read-only category map; exposed on the class for existing callers
+    categories = CATEGORIES
     
+    @daily_cache
     def fetch_papers_by_category(self, category: str, max_results: int = 5, days_back: int = 7) -> List[Dict[Any, Any]]:
         """
         Fetch recent papers from a specific arXiv category.
@@ -32,36 +249,13 @@ class ArxivFetcher:
         Returns:
             List of paper objects
         """
-        # Calculate date range for recent papers
-        date_cutoff = datetime.now() - timedelta(days=days_back)
-        
-        # Fetch 5x more papers initially to ensure we have enough new ones after filtering
-        initial_max_results = max_results * 5
-        
         try:
             print(f"  Fetching papers for {category}...")
-            results = []
             
-            # Use the newer Client API instead of deprecated Search.results()
-            client = arxiv.Client()
-            search = arxiv.Search(
-                query=f"cat:{category}",
-                max_results=initial_max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
-            )
+            response = _get_sync_http().get(ARXIV_API_URL, params=_search_params(category, max_results, days_back))
+            response.raise_for_status()
+            results = parse_arxiv_feed(response.content)
             
-            for paper in client.results(search):
-                # Some papers might not have published date
-                if not hasattr(paper, 'published'):
-                    continue
-                    
-                # Check if paper is within our date range
-                if paper.published.replace(tzinfo=None) >= date_cutoff:
-                    results.append(paper)
-                    if len(results) >= initial_max_results:
-                        break
-                        
             print(f"  Found {len(results)} recent papers in {category}")
             return results
             
@@ -69,9 +263,70 @@ class ArxivFetcher:
             print(f"Error fetching papers for category {category}: {str(e)}")
             return []
     
-    def fetch_all_categories(self, max_per_category: int = 3) -> Dict[str, List[Dict[Any, Any]]]:
+    async def _fetch_category_async(
+        self,
+        http: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        category: str,
+        max_results: int = 5,
+        days_back: int = 7
+    ) -> List[Any]:
         """
-        Fetch papers from all defined categories.
+        Async counterpart of fetch_papers_by_category that shares the pooled
+        async HTTP client.
+        """
+        key = _cache_key(category, max_results, days_back)
+        # The cache is a JSON file on disk; read and write it off the event loop
+        cached = await asyncio.to_thread(_load_cached, key)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with semaphore:
+                response = await http.get(ARXIV_API_URL, params=_search_params(category, max_results, days_back))
+                response.raise_for_status()
+            
+            papers = parse_arxiv_feed(response.content)
+            
+            if papers:
+                await asyncio.to_thread(_store_cached, key, papers)
+            return papers
+            
+        except Exception as e:
+            print(f"Error fetching papers for category {category}: {str(e)}")
+            return []
+    
+    async def fetch_categories(
+        self,
+        categories: Iterable[str],
+        max_results: int = 5,
+        days_back: int = 7
+    ) -> Dict[str, List[Any]]:
+        """
+        Fetch several categories concurrently over the shared async HTTP client.
+        
+        Args:
+            categories: arXiv category codes to fetch
+            max_results: Maximum number of papers per category
+            days_back: How many days back to search for papers
+            
+        Returns:
+            Dictionary mapping each category code to its papers (empty on error)
+        """
+        # Limit in-flight requests so we stay polite towards the arXiv API
+        semaphore = asyncio.Semaphore(4)
+        categories = list(categories)
+        
+        http = get_http_client()
+        results = await asyncio.gather(*(
+            self._fetch_category_async(http, semaphore, category, max_results, days_back)
+            for category in categories
+        ))
+        return dict(zip(categories, results))
+    
+    async def fetch_all_categories(self, max_per_category: int = 3) -> Dict[str, List[Dict[Any, Any]]]:
+        """
+        Fetch papers from all defined categories concurrently.
         
         Args:
             max_per_category: Maximum number of papers per category
@@ -79,15 +334,14 @@ class ArxivFetcher:
         Returns:
             Dictionary mapping category codes to lists of papers
         """
-        all_papers = {}
-        
         print("\nFetching papers from arXiv categories:")
         print("=====================================")
         
-        for category, category_name in self.categories.items():
-            print(f"\nCategory: {category} - {category_name}")
-            papers = self.fetch_papers_by_category(category, max_per_category)
-            
+        results = await self.fetch_categories(self.categories, max_per_category)
+        
+        all_papers = {}
+        for category, papers in results.items():
+            print(f"\nCategory: {category} - {self.categories[category]}")
             if papers:
                 print(f"  Successfully fetched {len(papers)} papers")
             else:
@@ -98,6 +352,7 @@ class ArxivFetcher:
         print("\nFinished fetching papers from all categories")
         return all_papers
     
-    def get_category_name(self, category_code: str) -> str:
+    @staticmethod
+    def get_category_name(category_code: str) -> str:
         """Get the human-readable name for a category code."""
-        return self.categories.get(category_code, "Unknown Category") 
\ No newline at end of file
+        return CATEGORIES.get(category_code, "Unknown Category") 
\ No newline at end of file
@@ -1,5 +1,9 @@
 # backend/database.py
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, IndexModel, MongoClient, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
+from bson import ObjectId
+from typing import Any, Dict, List, Optional, Set
+import asyncio
 import datetime
 import os
 
@@ -8,15 +12,157 @@ import os
 # MongoDB Configuration
 MONGO_URI = os.getenv("MONGODB_URI") 
 
+class MockCursor:
+    """A simple in-memory mock of an async MongoDB cursor."""
+    def __init__(self, docs):
+        self.docs = docs
+        
+    def sort(self, key, direction=1):
+        """Sort by a field name or a list of (field, direction) pairs."""
+        keys = [(key, direction)] if isinstance(key, str) else key
+        for field, field_direction in reversed(keys):
+            self.docs.sort(key=lambda x: x.get(field, ""), reverse=(field_direction == -1))
+        return self
+        
+    def skip(self, count):
+        self.docs = self.docs[count:]
+        return self
+        
+    def limit(self, count):
+        if count > 0:
+            self.docs = self.docs[:count]
+        return self
+        
+    async def to_list(self, length=None):
+        return self.docs if length is None else self.docs[:length]
+        
+    def __aiter__(self):
+        return self._iterate()
+        
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
 # Create mock MongoDB collections for fallback when real MongoDB is not available
 class MockCollection:
     """A simple in-memory mock of MongoDB collection for fallback."""
     def __init__(self, name):
         self.name = name
         self.data = {}
+        # Secondary indexes: field -> value -> set of _ids
+        self.indexes: Dict[str, Dict[Any, Set[str]]] = {}
+        # Field tuples whose combined values must be unique
+        self.unique_keys: List[tuple] = []
+        
+    async def create_index(self, keys, unique=False, **kwargs):
+        """Build an equality index on each field of keys (a name or a list of (field, direction))."""
+        fields = [keys] if isinstance(keys, str) else [field for field, _ in keys]
+        if unique and tuple(fields) not in self.unique_keys:
+            self.unique_keys.append(tuple(fields))
+        for field in fields:
+            if field in self.indexes:
+                continue
+            self.indexes[field] = {}
+            for doc_id, doc in self.data.items():
+                self._index_value(field, doc_id, doc)
+        return "_".join(f"{field}_1" for field in fields)
         
-    def find_one(self, query):
+    async def create_indexes(self, models):
+        """Simple implementation of create_indexes for IndexModel lists."""
+        names = []
+        for model in models:
+            document = model.document
+            names.append(await self.create_index(list(document["key"].items()), unique=document.get("unique", False)))
+        return names
+        
+    def _index_value(self, field, doc_id, doc):
+        """Add a single doc's field value to the index, skipping unhashable values."""
+        if field not in doc:
+            return
+        try:
+            self.indexes[field].setdefault(doc[field], set()).add(doc_id)
+        except TypeError:
+            pass
+            
+    def _index_doc(self, doc):
+        for field in self.indexes:
+            self._index_value(field, doc["_id"], doc)
+            
+    def _unindex_doc(self, doc):
+        for field, index in self.indexes.items():
+            if field not in doc:
+                continue
+            try:
+                ids = index.get(doc[field])
+            except TypeError:
+                continue
+            if ids:
+                ids.discard(doc["_id"])
+                
+    def _candidates(self, query):
+        """
+        Narrow the docs to scan using equality predicates on indexed fields.
+        Falls back to every document when no indexed predicate applies.
+        """
+        candidate_ids = None
+        for key, value in (query or {}).items():
+            if key not in self.indexes or isinstance(value, list):
+                continue
+            try:
+                if isinstance(value, dict):
+                    if set(value) != {"$in"}:
+                        continue
+                    ids = set().union(*(self.indexes[key].get(item, set()) for item in value["$in"]))
+                else:
+                    ids = self.indexes[key].get(value, set())
+            except TypeError:
+                continue
+            candidate_ids = set(ids) if candidate_ids is None else candidate_ids & ids
+            if not candidate_ids:
+                return []
+        if candidate_ids is None:
+            return list(self.data.values())
+        return [self.data[doc_id] for doc_id in candidate_ids]
+        
+    def _matches(self, doc, query):
+        """Check a doc against the equality, comparison, $and and $or predicates the app uses."""
+        for key, value in query.items():
+            if key == "$or":
+                if not any(self._matches(doc, condition) for condition in value):
+                    return False
+            elif key == "$and":
+                if not all(self._matches(doc, condition) for condition in value):
+                    return False
+            elif isinstance(value, dict) and value and all(op.startswith("$") for op in value):
+                if key not in doc or not all(self._compare(doc[key], op, operand) for op, operand in value.items()):
+                    return False
+            elif key not in doc or doc[key] != value:
+                return False
+        return True
+        
+    def _compare(self, field_value, operator, operand):
+        """Evaluate one query operator ($in, $lt, $lte, $gt, $gte) against a field value."""
+        try:
+            if operator == "$in":
+                return field_value in operand
+            if operator == "$lt":
+                return field_value < operand
+            if operator == "$lte":
+                return field_value <= operand
+            if operator == "$gt":
+                return field_value > operand
+            if operator == "$gte":
+                return field_value >= operand
+        except TypeError:
+            # Mongo only compares values of the same type
+            return False
+        raise NotImplementedError(f"Mock query does not support {operator}")
+        
+    async def find_one(self, query):
         """Simple implementation of find_one."""
+        return self._find_one(query)
+        
+    def _find_one(self, query):
         if not query:
             return None
         
@@ -25,44 +171,30 @@ class MockCollection:
             return self.data[query["_id"]]
             
         # Handle other field queries (very simplified)
-        for doc_id, doc in self.data.items():
-            match = True
-            for key, value in query.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
-            if match:
+        for doc in self._candidates(query):
+            if self._matches(doc, query):
                 return doc
         return None
         
-    def find(self, query=None, **kwargs):
+    def _project(self, doc, projection):
+        """Apply a MongoDB-style inclusion or exclusion projection to a doc."""
+        if not projection:
+            return doc
+        include = [key for key, value in projection.items() if value and key != "_id"]
+        if include:
+            projected = {key: doc[key] for key in include if key in doc}
+            if projection.get("_id", 1) and "_id" in doc:
+                projected["_id"] = doc["_id"]
+            return projected
+        return {key: value for key, value in doc.items() if projection.get(key, 1)}
+        
+    def find(self, query=None, projection=None, **kwargs):
         """Simple implementation of find."""
         results = []
         if not query:
             results = list(self.data.values())
         else:
-            for doc in self.data.values():
-                match = True
-                for key, value in query.items():
-                    if isinstance(value, dict) and "$or" in key:
-                        # Handle $or operator (simplified)
-                        or_conditions = value
-                        or_match = False
-                        for condition in or_conditions:
-                            for or_key, or_val in condition.items():
-                                if or_key in doc and doc[or_key] == or_val:
-                                    or_match = True
-                                    break
-                            if or_match:
-                                break
-                        if not or_match:
-                            match = False
-                            break
-                    elif key not in doc or doc[key] != value:
-                        match = False
-                        break
-                if match:
-                    results.append(doc)
+            results = [doc for doc in self._candidates(query) if self._matches(doc, query)]
                     
         # Handle sorting, skip, limit
         if "sort" in kwargs:
@@ -75,49 +207,131 @@ class MockCollection:
         if "limit" in kwargs and kwargs["limit"] > 0:
             results = results[:kwargs["limit"]]
             
-        # Return a list-like object
-        return results
+        if projection:
+            results = [self._project(doc, projection) for doc in results]
+            
+        return MockCursor(results)
         
-    def count_documents(self, query=None):
+    async def count_documents(self, query=None):
         """Simple implementation of count_documents."""
         if query is None:
             return len(self.data)
         
-        count = 0
-        for doc in self.data.values():
-            match = True
-            for key, value in query.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
-            if match:
-                count += 1
-        return count
-        
-    def insert_one(self, doc):
+        return sum(1 for doc in self._candidates(query) if self._matches(doc, query))
+        
+    async def distinct(self, key, query=None):
+        """Simple implementation of distinct."""
+        values = []
+        for doc in self._candidates(query):
+            if key in doc and doc[key] not in values and self._matches(doc, query or {}):
+                values.append(doc[key])
+        return values
+        
+    async def aggregate(self, pipeline):
+        """Simple implementation of aggregate for $match, $group and $facet stages."""
+        return MockCursor(self._aggregate(list(self.data.values()), pipeline))
+        
+    def _aggregate(self, docs, pipeline):
+        for stage in pipeline:
+            (operator, spec), = stage.items()
+            if operator == "$match":
+                docs = [doc for doc in docs if self._matches(doc, spec)]
+            elif operator == "$group":
+                docs = self._group(docs, spec)
+            elif operator == "$facet":
+                docs = [{name: self._aggregate(docs, sub_pipeline) for name, sub_pipeline in spec.items()}]
+            else:
+                raise NotImplementedError(f"Mock aggregate does not support {operator}")
+        return docs
+        
+    def _group(self, docs, spec):
+        """Group docs by the _id expression, supporting $sum accumulators only."""
+        groups = {}
+        accumulators = {name: value["$sum"] for name, value in spec.items() if name != "_id"}
+        for doc in docs:
+            key = self._evaluate(doc, spec["_id"])
+            group = groups.setdefault(key, {"_id": key, **{name: 0 for name in accumulators}})
+            for name, expression in accumulators.items():
+                group[name] += self._evaluate(doc, expression)
+        return list(groups.values())
+        
+    def _evaluate(self, doc, expression):
+        """Evaluate field paths, constants and the $cond/$eq operators."""
+        if isinstance(expression, str) and expression.startswith("$"):
+            return doc.get(expression[1:])
+        if isinstance(expression, dict):
+            if "$cond" in expression:
+                condition, if_true, if_false = expression["$cond"]
+                return self._evaluate(doc, if_true if self._evaluate(doc, condition) else if_false)
+            if "$eq" in expression:
+                left, right = expression["$eq"]
+                return self._evaluate(doc, left) == self._evaluate(doc, right)
+        return expression
+        
+    async def insert_one(self, doc):
         """Simple implementation of insert_one."""
+        return self._insert_one(doc)
+        
+    def _insert_one(self, doc):
         if "_id" not in doc:
-            import uuid
-            doc["_id"] = str(uuid.uuid4())
+            # Same id type as MongoDB, so cursors and lookups by _id work alike
+            doc["_id"] = ObjectId()
+        for fields in self.unique_keys:
+            # Docs missing a field are left out, like a sparse index
+            if not all(field in doc for field in fields):
+                continue
+            query = {field: doc[field] for field in fields}
+            if any(other["_id"] != doc["_id"] for other in self._candidates(query) if self._matches(other, query)):
+                raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} index: {fields}")
+        if doc["_id"] in self.data:
+            self._unindex_doc(self.data[doc["_id"]])
         self.data[doc["_id"]] = doc
+        self._index_doc(doc)
         return doc
         
-    def update_one(self, query, update, upsert=False):
+    async def update_one(self, query, update, upsert=False):
         """Simple implementation of update_one."""
-        doc = self.find_one(query)
+        return self._update_one(query, update, upsert)
+        
+    def _update_one(self, query, update, upsert=False):
+        """Apply update to the first match (or upsert); returns the updated doc, if any."""
+        doc = self._find_one(query)
         if doc:
             if "$set" in update:
+                self._unindex_doc(doc)
                 for key, value in update["$set"].items():
                     doc[key] = value
+                self._index_doc(doc)
         elif upsert:
             # Create new doc with query + update
             new_doc = {}
             for key, value in query.items():
                 new_doc[key] = value
-            if "$set" in update:
-                for key, value in update["$set"].items():
+            for operator in ("$setOnInsert", "$set"):
+                for key, value in update.get(operator, {}).items():
                     new_doc[key] = value
-            self.insert_one(new_doc)
+            doc = self._insert_one(new_doc)
+        return doc
+    
+    async def find_one_and_update(self, query, update, upsert=False, return_document=ReturnDocument.BEFORE):
+        """Simple implementation of find_one_and_update."""
+        before = self._find_one(query)
+        before = dict(before) if before else None
+        after = self._update_one(query, update, upsert)
+        return after if return_document == ReturnDocument.AFTER else before
+
+    async def delete_one(self, query):
+        """Simple implementation of delete_one."""
+        doc = self._find_one(query)
+        if doc:
+            self._unindex_doc(doc)
+            del self.data[doc["_id"]]
+        return None
+
+    async def bulk_write(self, requests, ordered=True):
+        """Simple implementation of bulk_write for UpdateOne requests."""
+        for request in requests:
+            self._update_one(request._filter, request._doc, upsert=request._upsert)
         return None
 
 class MockDatabase:
@@ -131,30 +345,45 @@ class MockDatabase:
             self.collections[name] = MockCollection(name)
         return self.collections[name]
 
+MONGO_CLIENT_OPTIONS = {
+    "serverSelectionTimeoutMS": 5000,  # 5 second timeout
+    "connectTimeoutMS": 10000,  # 10 second timeout
+    "socketTimeoutMS": 45000,  # 45 second timeout
+    "maxPoolSize": 50,  # Maximum connection pool size
+    # Compress wire traffic - summaries are long text; pymongo skips zstd
+    # with a warning if zstandard is missing and falls back to zlib
+    "compressors": "zstd,zlib"
+}
+
+client = None
+
 try:
     # Initialize MongoDB client with proper settings
     if MONGO_URI:
-        client = MongoClient(
-            MONGO_URI,
-            serverSelectionTimeoutMS=5000,  # 5 second timeout
-            connectTimeoutMS=10000,  # 10 second timeout
-            socketTimeoutMS=45000,  # 45 second timeout
-            maxPoolSize=50  # Maximum connection pool size
-        )
-        
-        # Test the connection
-        client.admin.command('ping')
+        # Test the connection with a short-lived sync client so an unreachable
+        # server still falls back to the mock at import time
+        with MongoClient(MONGO_URI, **MONGO_CLIENT_OPTIONS) as probe:
+            probe.admin.command('ping')
         print("Successfully connected to MongoDB")
         
+        # Native asyncio client; its operations are awaited on the event loop
+        client = AsyncMongoClient(MONGO_URI, **MONGO_CLIENT_OPTIONS)
+        
         # Initialize database and collection
         db = client.get_database("arxiv_summaries_db")
         paper_details_collection = db.get_collection("paper_details")
+        llm_cache_collection = db.get_collection("llm_cache")
+        pdf_text_cache_collection = db.get_collection("pdf_text_cache")
+        generation_claims_collection = db.get_collection("generation_claims")
         
     else:
         print("MONGODB_URI not set, using in-memory mock storage")
         # Use in-memory mock collections when MongoDB is not available
         mock_db = MockDatabase("arxiv_summaries_db")
         paper_details_collection = mock_db.get_collection("paper_details")
+        llm_cache_collection = mock_db.get_collection("llm_cache")
+        pdf_text_cache_collection = mock_db.get_collection("pdf_text_cache")
+        generation_claims_collection = mock_db.get_collection("generation_claims")
         
 except Exception as e:
     print(f"Error connecting to MongoDB: {str(e)}")
@@ -162,6 +391,281 @@ except Exception as e:
     # Use in-memory mock collections when MongoDB connection fails
     mock_db = MockDatabase("arxiv_summaries_db")
     paper_details_collection = mock_db.get_collection("paper_details")
+    llm_cache_collection = mock_db.get_collection("llm_cache")
+    pdf_text_cache_collection = mock_db.get_collection("pdf_text_cache")
+    generation_claims_collection = mock_db.get_collection("generation_claims")
+
+# Each list query filters on an equality prefix and sorts on published_date, so
+# the index returns documents already in order instead of sorting them in memory
+PAPER_INDEXES = [
+    IndexModel([("arxiv_id", 1)], unique=True),
+    # Not unique: different papers can share a title
+    IndexModel([("slug", 1)]),
+    IndexModel([("category_code", 1), ("published_date", -1)]),
+    IndexModel([("category_code", 1), ("processed_date", 1), ("published_date", -1)]),
+    # Pages sort on (published_date, _id) so keyset pagination has a stable order
+    IndexModel([("category_slug", 1), ("processed_date", 1), ("published_date", -1), ("_id", -1)]),
+    IndexModel([("category_slug", 1), ("published_date", -1), ("_id", -1)]),
+    IndexModel([("processed_date", 1), ("published_date", -1), ("_id", -1)]),
+]
+
+async def ensure_indexes(collection):
+    """Create the indexes the API queries rely on; safe to call on every startup."""
+    try:
+        # One createIndexes command for all of them
+        await collection.create_indexes(PAPER_INDEXES)
+        return
+    except Exception as e:
+        print(f"Error creating indexes together, retrying one by one: {str(e)}")
+    for index in PAPER_INDEXES:
+        try:
+            await collection.create_indexes([index])
+        except Exception as e:
+            # e.g. existing duplicates prevent building a unique index
+            print(f"Error creating index {index.document['name']}: {str(e)}")
+
+# Cached LLM responses expire after 30 days
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+# Generation claims expire after an hour, so a crashed run can't block its category all day
+GENERATION_CLAIM_TTL_SECONDS = 60 * 60
+
+_initialized = False
+
+async def init_database():
+    """Create the paper and cache indexes once per process; call before serving requests."""
+    global _initialized
+    if _initialized:
+        return
+    _initialized = True
+    
+    await ensure_indexes(paper_details_collection)
+    
+    for cache_collection in (llm_cache_collection, pdf_text_cache_collection):
+        try:
+            await cache_collection.create_index("created_at", expireAfterSeconds=LLM_CACHE_TTL_SECONDS)
+        except Exception as e:
+            print(f"Error creating {cache_collection.name} TTL index: {str(e)}")
+    
+    claim_indexes = [
+        ([("category", 1), ("date", 1)], {"unique": True}),
+        ("created_at", {"expireAfterSeconds": GENERATION_CLAIM_TTL_SECONDS}),
+    ]
+    for keys, options in claim_indexes:
+        try:
+            await generation_claims_collection.create_index(keys, **options)
+        except Exception as e:
+            print(f"Error creating generation claim index {keys}: {str(e)}")
+
+async def claim_generation(category: str, date: str) -> Optional[ObjectId]:
+    """
+    Atomically claim a category's generation for a date. Returns the owner
+    token needed to release the claim, or None if another run already holds
+    it (the unique index rejects the insert).
+    """
+    owner = ObjectId()
+    try:
+        await generation_claims_collection.insert_one({
+            "category": category,
+            "date": date,
+            "owner": owner,
+            "state": "running",
+            "created_at": datetime.datetime.now(datetime.timezone.utc)
+        })
+        return owner
+    except DuplicateKeyError:
+        return None
+
+async def release_generation(category: str, date: str, owner: ObjectId):
+    """
+    Drop a category's generation claim if owner still holds it. A claim that
+    expired and was taken by another run is left alone.
+    """
+    await generation_claims_collection.delete_one({"category": category, "date": date, "owner": owner})
+
+async def refresh_generation(category: str, date: str, owner: ObjectId):
+    """Restart the TTL of owner's claim, for runs that may outlast it."""
+    await generation_claims_collection.update_one(
+        {"category": category, "date": date, "owner": owner},
+        {"$set": {"created_at": datetime.datetime.now(datetime.timezone.utc)}}
+    )
+
+async def claimed_categories(date: str) -> Set[str]:
+    """Categories whose generation for date is currently claimed."""
+    return set(await generation_claims_collection.distinct("category", {"date": date}))
+
+async def close_database():
+    """Close the MongoDB client, if one was opened."""
+    if client is not None:
+        await client.close()
+
+async def get_cached_llm_response(key: str):
+    """Return the cached completion content for key, or None."""
+    doc = await llm_cache_collection.find_one({"_id": key})
+    return doc["content"] if doc else None
+
+async def store_cached_llm_response(key: str, model: str, content: str):
+    """Store a completion under key; the TTL index on created_at expires it."""
+    await llm_cache_collection.update_one(
+        {"_id": key},
+        {"$set": {
+            "model": model,
+            "content": content,
+            "created_at": datetime.datetime.now(datetime.timezone.utc)
+        }},
+        upsert=True
+    )
+
+async def get_cached_pdf_text(arxiv_id: str):
+    """Return the extracted PDF text stored for arxiv_id, or None."""
+    doc = await pdf_text_cache_collection.find_one({"_id": arxiv_id})
+    return doc["text"] if doc else None
+
+async def store_cached_pdf_text(arxiv_id: str, text: str):
+    """Store extracted PDF text so reruns can skip the download and parse."""
+    await pdf_text_cache_collection.update_one(
+        {"_id": arxiv_id},
+        {"$set": {"text": text, "created_at": datetime.datetime.now(datetime.timezone.utc)}},
+        upsert=True
+    )
+
+# Lightweight fields for list-style reads; leaves out the large LLM summary and PDF analysis
+PAPER_SUMMARY_PROJECTION = {
+    "title": 1,
+    "slug": 1,
+    "arxiv_id": 1,
+    "category_code": 1,
+    "published_date": 1,
+    "_id": 0
+}
+
+# Fields the paper list pages render (plus _id, which keyset pagination needs);
+# leaves out summary_sections and pdf_analysis, which only the detail page shows
+LIST_PROJECTION = {
+    "title": 1,
+    "slug": 1,
+    "authors": 1,
+    "category_code": 1,
+    "category_name": 1,
+    "category_slug": 1,
+    "arxiv_id": 1,
+    "published_date": 1,
+    "processed_date": 1,
+    "url": 1,
+    "generation_date": 1
+}
+
+async def list_papers(category: str = None, limit: int = 0, processed_date: str = None):
+    """List paper metadata for a category without fetching the heavy summary fields."""
+    query = {}
+    if category:
+        query["category_code"] = category
+    if processed_date:
+        query["processed_date"] = processed_date
+    cursor = paper_details_collection.find(query, PAPER_SUMMARY_PROJECTION, limit=limit)
+    return await cursor.to_list(length=None)
+
+def _counts_by_category(groups) -> Dict[str, int]:
+    return {group["_id"]: group["count"] for group in groups if group["_id"] is not None}
+
+async def count_papers_by_category() -> Dict[str, int]:
+    """Number of stored papers per category_code, from one aggregation."""
+    cursor = await paper_details_collection.aggregate([
+        {"$group": {"_id": "$category_code", "count": {"$sum": 1}}}
+    ])
+    return _counts_by_category(await cursor.to_list(length=None))
+
+async def count_papers_for_status(processed_date: str, categories: List[str] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Per-category paper counts for the generation status, as
+    {code: {"today": n, "total": n}}, from one pass of a single $group.
+    Passing categories limits the pass to those category codes.
+    """
+    pipeline = []
+    if categories is not None:
+        # Served from the category_code index prefix instead of every document
+        pipeline.append({"$match": {"category_code": {"$in": list(categories)}}})
+    pipeline.append(
+        {"$group": {
+            "_id": "$category_code",
+            "total": {"$sum": 1},
+            "today": {"$sum": {"$cond": [{"$eq": ["$processed_date", processed_date]}, 1, 0]}}
+        }}
+    )
+    cursor = await paper_details_collection.aggregate(pipeline)
+    return {
+        group["_id"]: {"today": group["today"], "total": group["total"]}
+        for group in await cursor.to_list(length=None)
+        if group["_id"] is not None
+    }
+
+def paper_upsert(paper: Dict[str, Any]) -> UpdateOne:
+    """Upsert of a paper document keyed by its arxiv_id."""
+    return UpdateOne({"arxiv_id": paper["arxiv_id"]}, {"$set": paper}, upsert=True)
+
+async def insert_paper_if_absent(paper: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Atomically insert a paper unless one with its arxiv_id is already stored.
+    Returns the stored document, which is the existing one if another request
+    saved the paper first.
+    """
+    return await paper_details_collection.find_one_and_update(
+        {"arxiv_id": paper["arxiv_id"]},
+        {"$setOnInsert": paper},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+class AsyncBulkWriter:
+    """
+    Queue write operations and send them as unordered bulk_write calls, once
+    max_batch are queued or max_delay seconds after the first one, with at
+    most max_inflight writes running at a time. Call flush() when done.
+    """
+    def __init__(self, collection, max_batch: int = 100, max_delay: float = 0.5, max_inflight: int = 4):
+        self.collection = collection
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.inflight = asyncio.Semaphore(max_inflight)
+        self.pending: List[Any] = []
+        self.tasks: Set[asyncio.Task] = set()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.errors: List[Exception] = []
+        
+    async def enqueue(self, operation):
+        """Queue one operation (e.g. UpdateOne); it is written in the next batch."""
+        self.pending.append(operation)
+        if len(self.pending) >= self.max_batch:
+            self._dispatch()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.max_delay, self._dispatch)
+            
+    def _dispatch(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        task = asyncio.ensure_future(self._write(batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        
+    async def _write(self, batch):
+        async with self.inflight:
+            try:
+                await self.collection.bulk_write(batch, ordered=False)
+            except Exception as e:
+                print(f"Error bulk writing {len(batch)} operations: {str(e)}")
+                self.errors.append(e)
+                
+    async def flush(self):
+        """Write everything queued so far; re-raises the first failed write, if any."""
+        self._dispatch()
+        if self.tasks:
+            await asyncio.gather(*self.tasks)
+        if self.errors:
+            error, self.errors = self.errors[0], []
+            raise error
 
 # You can add helper functions here if needed, for example:
 # def get_summary_by_date(date_str: str):
@@ -171,5 +675,5 @@ except Exception as e:
 #     return summaries_collection.insert_one({
 #         "date": date_str,
 #         "summary_content": summary_content,
-#         "created_at": datetime.datetime.utcnow()
+#         "created_at": datetime.datetime.now(datetime.timezone.utc)
 #     }) 
\ No newline at end of file
@@ -0,0 +1,32 @@
+import httpx
+
+# HTTP/2 needs the optional h2 package; without it httpx falls back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_http = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide AsyncClient shared by arXiv queries, PDF downloads
+    and OpenAI requests, so they all reuse one connection pool.
+    """
+    global _http
+    if _http is None or _http.is_closed:
+        _http = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=45,
+            follow_redirects=True
+        )
+    return _http
+
+async def close_http_client() -> None:
+    """Close the shared client; the next get_http_client() call opens a new one."""
+    global _http
+    if _http is not None and not _http.is_closed:
+        await _http.aclose()
+    _http = None
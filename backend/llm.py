@@ -1,16 +1,231 @@
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator, Awaitable
 from pathlib import Path
-import PyPDF2
-import tempfile
+import httpx
 import asyncio
+import atexit
+import functools
+import hashlib
+import logging
+import json
+import pickle
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import numpy as np
+import tiktoken
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from arxiv_fetcher import PaperRecord
+from pdf_text import extract_pdf_pages
+from http_client import get_http_client
+from database import (
+    get_cached_llm_response,
+    store_cached_llm_response,
+    get_cached_pdf_text,
+    store_cached_pdf_text
+)
+
+logger = logging.getLogger(__name__)
+
+# Titles are ranked by similarity to this description of the papers we want to feature
+SCORING_ANCHOR = "novel, high-impact, technically significant research contribution"
+EMBEDDING_BATCH_SIZE = 100
+
+# Prompt size for the PDF-refined summary; the PDF excerpt fills what metadata leaves
+SUMMARY_PROMPT_TOKEN_BUDGET = 4000
+CHARS_PER_TOKEN_ESTIMATE = 4
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Tokenizer for the summary model, or None if it can't be loaded (the BPE
+    file is downloaded on first use) - callers then estimate from length.
+    """
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except Exception as e:
+        logger.warning("tiktoken unavailable, estimating token counts: %s", str(e)[:80])
+        return None
+
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN_ESTIMATE
+    return len(encoding.encode(text))
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN_ESTIMATE]
+    tokens = encoding.encode(text)
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+# Summary prompt pieces: the shared metadata/instructions prefix, then the PDF
+# excerpt and abstract-only draft appended for the refine call
+SUMMARY_PROMPT_TEMPLATE = """
+        Title: {title}
+        Authors: {authors}
+        Abstract: {abstract}
+        
+        Please provide a comprehensive analysis of this research paper covering:
+        1. Main objective and motivation (from abstract)
+        2. Key methodology or approach (from PDF content)
+        3. Most significant findings or contributions
+        4. Technical details and implementation insights (from PDF)
+        5. Potential impact and applications
+        
+        Format the response as:
+        SUMMARY: [200-word detailed summary incorporating PDF content]
+        METHODOLOGY: [Key technical approaches found in the paper]
+        FINDINGS: [Main results and contributions]
+        TECHNICAL_DETAILS: [Important implementation details from the PDF]
+        IMPACT: [Potential applications and significance]
+        """
+PDF_EXCERPT_HEADER = """
+        Additional Content from PDF Introduction:
+        """
+DRAFT_REFINE_TEMPLATE = """
+        Draft analysis written from the abstract alone - keep what holds up and
+        refine it with the PDF content:
+        {draft}
+        """
+
+# Bulk runs submit summaries as one Batch API job per category and poll it
+BATCH_POLL_INTERVAL_SECONDS = 60
+# Jobs still running after this are cancelled and summarized paper by paper
+BATCH_MAX_WAIT_SECONDS = 2 * 60 * 60
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Sections of a paper analysis, in the order they are rendered
+SUMMARY_SECTIONS = ("summary", "methodology", "findings", "technical_details", "impact")
+# Output budget per selected paper in select_and_summarize: a 200-word summary
+# plus four more sections, wrapped in JSON
+SELECT_SUMMARY_TOKENS_PER_PAPER = 1200
+
+# Titles this similar (revisions, near-duplicates) reuse an existing summary
+SEMANTIC_CACHE_PATH = Path(".cache") / "semantic_summaries.pkl"
+SEMANTIC_CACHE_THRESHOLD = 0.95
+# Only the most recent summaries are kept, and the file is rewritten once per
+# batch of additions (plus once at exit) rather than on every add
+SEMANTIC_CACHE_MAX_ENTRIES = 2000
+SEMANTIC_CACHE_SAVE_EVERY = 25
+# Title embeddings kept between ranking and summarizing; a bulk run ranks about
+# 11 categories x 150 candidates
+TITLE_EMBEDDING_CACHE_SIZE = 4096
+
+class SemanticSummaryCache:
+    """
+    The most recent summaries indexed by L2-normalized title embedding,
+    persisted with pickle. Embeddings live in a fixed-size ring buffer, so
+    adding one overwrites the oldest entry instead of reallocating.
+    """
+    def __init__(self, path: Path, max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.embeddings = None  # (max_entries, dim) buffer; the first count rows are filled
+        self.summaries: List[Dict[str, Any]] = []
+        self.count = 0
+        self.next_slot = 0  # Ring position the next add writes to
+        self.unsaved = 0
+        try:
+            with open(path, "rb") as cache_file:
+                embeddings, summaries = pickle.load(cache_file)
+            # Stored oldest first; keep the newest max_entries
+            for embedding, summary in zip(embeddings[-max_entries:], summaries[-max_entries:]):
+                self._store(embedding, summary)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass
+    
+    def _store(self, embedding: np.ndarray, summary: Dict[str, Any]) -> None:
+        if self.embeddings is None:
+            self.embeddings = np.empty((self.max_entries, embedding.shape[0]), dtype=np.float32)
+        self.embeddings[self.next_slot] = embedding
+        if self.next_slot < len(self.summaries):
+            self.summaries[self.next_slot] = summary
+        else:
+            self.summaries.append(summary)
+        self.next_slot = (self.next_slot + 1) % self.max_entries
+        self.count = min(self.count + 1, self.max_entries)
+    
+    def lookup(self, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Return the summary of the most similar title if it clears the threshold."""
+        with self.lock:
+            if not self.count:
+                return None
+            similarities = self.embeddings[:self.count] @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < SEMANTIC_CACHE_THRESHOLD:
+                return None
+            return self.summaries[best]
+    
+    def add(self, embedding: np.ndarray, summary: Dict[str, Any]) -> None:
+        """Index a summary, persisting the cache once a batch of additions has built up."""
+        with self.lock:
+            self._store(embedding, summary)
+            self.unsaved += 1
+            if self.unsaved >= SEMANTIC_CACHE_SAVE_EVERY:
+                self._save()
+    
+    def save(self) -> None:
+        """Persist any additions that haven't been written yet."""
+        with self.lock:
+            if self.unsaved:
+                self._save()
+    
+    def _save(self) -> None:
+        """Write the entries oldest first; failures only cost future hits."""
+        # Once the ring is full, the oldest entry sits at next_slot
+        start = self.next_slot if self.count == self.max_entries else 0
+        order = [(start + i) % self.max_entries for i in range(self.count)]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as cache_file:
+                pickle.dump((self.embeddings[order], [self.summaries[i] for i in order]), cache_file)
+            self.unsaved = 0
+        except OSError as e:
+            logger.warning("Semantic cache write failed: %s", e)
+
+@functools.lru_cache(maxsize=1)
+def _get_semantic_cache() -> SemanticSummaryCache:
+    """Process-wide semantic cache, loaded from disk on first use and saved at exit."""
+    cache = SemanticSummaryCache(SEMANTIC_CACHE_PATH)
+    atexit.register(cache.save)
+    return cache
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Process-wide pool for blocking work, shared by every LLMSummarizer. Most of
+    its tasks are cache reads/writes against MongoDB, so it is sized for I/O.
+    """
+    executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-io")
+    atexit.register(executor.shutdown, wait=False)
+    return executor
+
+@functools.lru_cache(maxsize=1)
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Process-wide pool for PDF text extraction. PyMuPDF holds the GIL while it
+    parses, so it runs in worker processes to keep the event loop responsive.
+    Workers are spawned rather than forked (this process runs threads) and
+    only import the lightweight pdf_text module.
+    """
+    pool = ProcessPoolExecutor(
+        max_workers=max(1, (os.cpu_count() or 2) - 1),
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    atexit.register(pool.shutdown, wait=False)
+    return pool
 
 class LLMSummarizer:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, use_llm_scoring: bool = False):
         """Initialize the LLM summarizer with OpenAI API key."""
         if api_key:
             self.api_key = api_key
@@ -19,220 +234,496 @@ class LLMSummarizer:
             if not self.api_key:
                 raise ValueError("OpenAI API key not provided and not found in environment variables")
         
-        # Initialize the OpenAI client with the new API
+        # Initialize the async OpenAI client so requests don't tie up executor threads;
+        # it rides on the shared connection pool instead of opening its own
         try:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=get_http_client(),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                max_retries=2
+            )
         except Exception as e:
-            print(f"Error initializing OpenAI client: {str(e)}")
+            logger.error("Error initializing OpenAI client: %s", e)
             raise e
             
         self.model = "gpt-4o-mini"  # Using GPT-4o-mini as specified
-        self.executor = ThreadPoolExecutor(max_workers=5)  # For CPU-bound tasks
+        self.embedding_model = "text-embedding-3-small"  # Title ranking only needs embeddings
+        self.use_llm_scoring = use_llm_scoring  # Fall back to chat-based title scoring
+        self._anchor_embedding = None  # Embedded on first ranking
+        # Normalized, reused by the semantic cache; an LRU bounded to the titles of recent runs
+        self._title_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.semantic_cache = _get_semantic_cache()
+        self.executor = _get_executor()  # Shared pool for blocking cache I/O
+        self.llm_semaphore = asyncio.Semaphore(20)  # Stay within OpenAI rate limits
+        self.download_semaphore = asyncio.Semaphore(8)  # Concurrent PDF downloads from arxiv.org
+        self.pdf_dir = Path("paper_downloads")  # Downloaded PDFs kept for user reference
+        self.pdf_dir.mkdir(exist_ok=True)
+    
+    async def _cached_chat(
+        self,
+        messages: List[Dict[str, str]],
+        on_delta: Optional[Callable[[str], Any]] = None,
+        **kwargs
+    ) -> str:
+        """
+        Run a chat completion, reusing a stored response for an identical request.
+        
+        The cache key hashes the model, messages and sampling parameters, so the
+        same prompt on a later run is served from the llm_cache collection.
+        With on_delta, the completion is streamed and each text fragment is
+        passed to it as it arrives (a cache hit is passed as one fragment).
+        """
+        key = self._chat_cache_key(messages, **kwargs)
+        
+        try:
+            cached = await get_cached_llm_response(key)
+            if cached is not None:
+                if on_delta is not None:
+                    on_delta(cached)
+                return cached
+        except Exception as e:
+            logger.warning("LLM cache lookup failed: %s", e)
+        
+        async with self.llm_semaphore:
+            if on_delta is None:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    **kwargs
+                )
+                content = response.choices[0].message.content.strip()
+                finish_reason = response.choices[0].finish_reason
+            else:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                    **kwargs
+                )
+                parts = []
+                finish_reason = None
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        on_delta(delta)
+                    finish_reason = chunk.choices[0].finish_reason or finish_reason
+                content = "".join(parts).strip()
+        
+        # Only complete responses are cached; a reply cut off at max_tokens
+        # would otherwise be served for every identical request
+        if finish_reason != "stop":
+            logger.warning("LLM response not cached (finish_reason=%s)", finish_reason)
+            return content
+        try:
+            await store_cached_llm_response(key, self.model, content)
+        except Exception as e:
+            logger.warning("LLM cache store failed: %s", e)
+        return content
+    
+    def _chat_cache_key(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Hash of the model, messages and sampling parameters of a chat request."""
+        return hashlib.sha256(
+            json.dumps({"model": self.model, "messages": messages, **kwargs}, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+    
+    async def _fetch_pdf_bytes(self, paper: Any) -> bytes:
+        """Download a paper's PDF into memory."""
+        async with self.download_semaphore:
+            response = await get_http_client().get(paper.pdf_url, timeout=60)
+            response.raise_for_status()
+            return response.content
+    
+    async def _extract_text(self, pdf_bytes: bytes, max_chars: Optional[int] = None) -> str:
+        """
+        Extract text from in-memory PDF bytes - opening and extracting all
+        pages happens in a single task in the PDF process pool.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            get_pdf_pool(),
+            functools.partial(extract_pdf_pages, pdf_bytes, max_chars=max_chars)
+        )
     
     async def extract_pdf_text(self, paper: Any) -> str:
         """
         Download and extract text from a paper's PDF asynchronously.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            # Create a temporary directory for PDF download
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir) / "temp_paper.pdf"
-                
-                # Download PDF to temporary location - run in thread pool
-                await asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    paper.download_pdf,
-                    temp_dir,
-                    "temp_paper.pdf"
-                )
-                
-                # Extract text from PDF - run in thread pool
-                text_content = []
-                async def extract_page_text(page):
-                    return await asyncio.get_event_loop().run_in_executor(
-                        self.executor,
-                        lambda: page.extract_text()
-                    )
-
-                async with asyncio.Lock():  # Ensure thread-safe PDF reading
-                    with open(temp_path, 'rb') as pdf_file:
-                        pdf_reader = PyPDF2.PdfReader(pdf_file)
-                        max_pages = min(5, len(pdf_reader.pages))
-                        
-                        # Extract text from pages concurrently
-                        tasks = [extract_page_text(pdf_reader.pages[i]) for i in range(max_pages)]
-                        text_content = await asyncio.gather(*tasks)
-                
-                elapsed = time.time() - start_time
-                print(f"  ✓ PDF processing completed in {elapsed:.2f} seconds")
-                return "\n".join(text_content)
+            # Download the PDF straight into memory, no temporary file
+            pdf_bytes = await self._fetch_pdf_bytes(paper)
+            text_content = await self._extract_text(pdf_bytes)
+            
+            elapsed = time.perf_counter() - start_time
+            logger.info("PDF processing completed in %.2fs", elapsed, extra={"elapsed_s": elapsed, "paper_id": paper.entry_id})
+            return text_content
                 
         except Exception as e:
-            elapsed = time.time() - start_time
-            print(f"  ✗ Error extracting PDF text ({elapsed:.2f}s): {str(e)}")
+            elapsed = time.perf_counter() - start_time
+            logger.error("Error extracting PDF text (%.2fs): %s", elapsed, e, extra={"elapsed_s": elapsed, "paper_id": paper.entry_id})
             return ""
     
     async def score_papers_by_title(self, papers: List[Any], top_k: int = 1) -> List[Any]:
         """Score and select the most interesting papers based on their titles."""
-        start_time = time.time()
         if not papers:
             return []
+        selected = await self.score_papers_multicategory({"papers": papers}, top_k=top_k)
+        return selected["papers"]
+    
+    async def score_papers_multicategory(self, papers_by_cat: Dict[str, List[Any]], top_k: int = 1) -> Dict[str, List[Any]]:
+        """
+        Score titles for several categories in one batch and select the top_k
+        papers of each category. Titles are ranked by embedding similarity
+        unless use_llm_scoring is set, in which case a chat model scores them.
+        
+        Args:
+            papers_by_cat: Mapping of category code to candidate papers
+            top_k: Number of papers to keep per category
             
-        # Prepare titles for scoring
-        titles_with_ids = [(i, paper.title) for i, paper in enumerate(papers)]
-        titles_text = "\n".join([f"{i+1}. {title}" for i, title in enumerate([t for _, t in titles_with_ids])])
+        Returns:
+            Mapping of category code to its selected papers
+        """
+        start_time = time.perf_counter()
+        papers_by_cat = {cat: papers for cat, papers in papers_by_cat.items() if papers}
+        if not papers_by_cat:
+            return {}
         
-        prompt = f"""Below are research paper titles. Score each title from 1-10 based on:
+        try:
+            if self.use_llm_scoring:
+                selected = await self._rank_with_llm(papers_by_cat, top_k)
+            else:
+                selected = await self._rank_with_embeddings(papers_by_cat, top_k)
+            
+            elapsed = time.perf_counter() - start_time
+            logger.info("Paper scoring for %d categories completed in %.2fs", len(papers_by_cat), elapsed, extra={"elapsed_s": elapsed})
+            return selected
+            
+        except Exception as e:
+            elapsed = time.perf_counter() - start_time
+            logger.error("Error scoring papers (%.2fs): %s", elapsed, e, extra={"elapsed_s": elapsed})
+            return {cat: papers[:top_k] for cat, papers in papers_by_cat.items()}
+    
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in batches of EMBEDDING_BATCH_SIZE, returning one row per text."""
+        batches = [texts[i:i + EMBEDDING_BATCH_SIZE] for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)]
+        
+        async def embed_batch(batch):
+            async with self.llm_semaphore:
+                return await self.client.embeddings.create(model=self.embedding_model, input=batch)
+        
+        responses = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return np.array([item.embedding for response in responses for item in response.data], dtype=np.float32)
+    
+    async def _get_anchor_embedding(self) -> np.ndarray:
+        """Embed the scoring anchor once and reuse it for every ranking."""
+        if self._anchor_embedding is None:
+            self._anchor_embedding = (await self._embed([SCORING_ANCHOR]))[0]
+        return self._anchor_embedding
+    
+    async def _rank_with_embeddings(self, papers_by_cat: Dict[str, List[Any]], top_k: int) -> Dict[str, List[Any]]:
+        """Rank titles by cosine similarity to the scoring anchor."""
+        titles = [paper.title for papers in papers_by_cat.values() for paper in papers]
+        title_embs, anchor = await asyncio.gather(self._embed(titles), self._get_anchor_embedding())
+        title_embs = title_embs / np.linalg.norm(title_embs, axis=1, keepdims=True)
+        similarities = title_embs @ anchor / np.linalg.norm(anchor)
+        # Keep the embeddings so the semantic summary cache doesn't embed these titles again
+        for title, embedding in zip(titles, title_embs):
+            self._remember_title_embedding(title, embedding)
+        
+        selected = {}
+        offset = 0
+        for cat, papers in papers_by_cat.items():
+            scores = similarities[offset:offset + len(papers)]
+            offset += len(papers)
+            ranked = np.argsort(-scores, kind="stable")
+            selected[cat] = [papers[i] for i in ranked[:top_k]]
+        return selected
+    
+    async def _rank_with_llm(self, papers_by_cat: Dict[str, List[Any]], top_k: int) -> Dict[str, List[Any]]:
+        """Rank titles with a single structured-output chat completion across all categories."""
+        # Group titles under a tag per category so the scores can be split back out
+        sections = []
+        for cat, papers in papers_by_cat.items():
+            titles_text = "\n".join(f"{i+1}. {paper.title}" for i, paper in enumerate(papers))
+            sections.append(f"[{cat}]\n{titles_text}")
+        total_titles = sum(len(papers) for papers in papers_by_cat.values())
+        
+        prompt = f"""Below are research paper titles grouped by arXiv category. Score each title from 1-10 based on:
 - Innovation and novelty (new methods, approaches, or findings)
 - Potential impact in the field
 - Technical significance
 - Clarity and specificity of the contribution
 
 Papers:
-{titles_text}
-
-Format your response as:
-1. Score: X - One sentence explanation
-2. Score: X - One sentence explanation
-...
+{chr(10).join(sections)}
 
-Only output the scores and explanations, nothing else."""
+For each category tag return only the integer scores, one per title in the order listed."""
+        
+        # Strict schemas need every key listed, so build one per request from the categories
+        schema = {
+            "type": "object",
+            "properties": {
+                cat: {"type": "array", "items": {"type": "integer"}}
+                for cat in papers_by_cat
+            },
+            "required": list(papers_by_cat),
+            "additionalProperties": False
+        }
+        
+        content = await self._cached_chat(
+            messages=[
+                {"role": "system", "content": "You are a research expert who evaluates paper significance."},
+                {"role": "user", "content": prompt}
+            ],
+            # ~4 tokens per score plus the category keys and JSON punctuation
+            max_tokens=8 + 4 * total_titles + 6 * len(papers_by_cat),
+            temperature=0.3,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "paper_scores", "schema": schema, "strict": True}
+            }
+        )
+        scores_by_cat = json.loads(content)
         
+        selected = {}
+        for cat, papers in papers_by_cat.items():
+            # The schema guarantees integers but not the list length; pad short lists
+            # with a neutral 5 and clamp out-of-range scores
+            raw_scores = scores_by_cat[cat]
+            scores = [
+                min(max(raw_scores[i], 1), 10) if i < len(raw_scores) else 5
+                for i in range(len(papers))
+            ]
+            ranked = sorted(range(len(papers)), key=lambda i: scores[i], reverse=True)
+            selected[cat] = [papers[i] for i in ranked[:top_k]]
+        return selected
+    
+    async def _load_pdf_text(self, paper: PaperRecord, pdf_path: Path, start_time: float):
+        """
+        Return (pdf_text, pdf_status) for a paper, reusing the text cached by
+        arxiv_id when the saved PDF from a previous run is still on disk.
+        """
         try:
-            # Run OpenAI API call in thread pool
-            response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a research expert who evaluates paper significance."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=200,
-                    temperature=0.3
-                )
+            cached_text = await get_cached_pdf_text(paper.entry_id)
+        except Exception as e:
+            logger.warning("PDF text cache lookup failed: %s", e)
+            cached_text = None
+        if cached_text is not None and pdf_path.exists():
+            logger.info("Using cached PDF text", extra={"paper_id": paper.entry_id})
+            return cached_text, "Successfully downloaded"
+        
+        # Download the PDF once, then save it for user reference and extract its
+        # text from the same bytes concurrently
+        pdf_text = ""
+        try:
+            pdf_bytes = await self._fetch_pdf_bytes(paper)
+            write_result, text_result = await asyncio.gather(
+                asyncio.to_thread(pdf_path.write_bytes, pdf_bytes),
+                # The prompt has room for at most SUMMARY_PROMPT_TOKEN_BUDGET tokens
+                self._extract_text(pdf_bytes, max_chars=SUMMARY_PROMPT_TOKEN_BUDGET * CHARS_PER_TOKEN_ESTIMATE),
+                return_exceptions=True
             )
             
-            # Parse scores from response
-            scores_text = response.choices[0].message.content.strip().split('\n')
-            scores = []
-            
-            for i, score_text in enumerate(scores_text):
+            if isinstance(write_result, Exception):
+                pdf_status = f"Download failed: {str(write_result)[:50]}..."
+            else:
+                pdf_status = "Successfully downloaded"
+                
+            if isinstance(text_result, Exception):
+                logger.error("Error extracting PDF text: %s", text_result, extra={"paper_id": paper.entry_id})
+            else:
+                # Empty text (encrypted or scanned PDF) is cached too, so reruns skip it
+                pdf_text = text_result
+                elapsed = time.perf_counter() - start_time
+                logger.info("PDF processing completed in %.2fs", elapsed, extra={"elapsed_s": elapsed, "paper_id": paper.entry_id})
                 try:
-                    score = int(score_text.split('Score: ')[1].split(' -')[0])
-                    scores.append((score, i))
-                except:
-                    scores.append((5, i))
-            
-            # Sort by score and get top_k papers
-            scores.sort(reverse=True)
-            selected_indices = [titles_with_ids[idx][0] for score, idx in scores[:top_k]]
-            
-            elapsed = time.time() - start_time
-            print(f"  ✓ Paper scoring completed in {elapsed:.2f} seconds")
-            return [papers[i] for i in selected_indices]
-            
+                    await store_cached_pdf_text(paper.entry_id, pdf_text)
+                except Exception as e:
+                    logger.warning("PDF text cache store failed: %s", e)
+        except Exception as e:
+            pdf_status = f"Download failed: {str(e)[:50]}..."
+            logger.error("Error downloading PDF: %s", e, extra={"paper_id": paper.entry_id})
+        return pdf_text, pdf_status
+    
+    def _remember_title_embedding(self, title: str, embedding: np.ndarray) -> None:
+        """Keep a title embedding, dropping the least recently used beyond the limit."""
+        self._title_embeddings[title] = embedding
+        self._title_embeddings.move_to_end(title)
+        if len(self._title_embeddings) > TITLE_EMBEDDING_CACHE_SIZE:
+            self._title_embeddings.popitem(last=False)
+    
+    async def _title_embedding(self, title: str) -> np.ndarray:
+        """Normalized title embedding, reusing the one computed during ranking."""
+        embedding = self._title_embeddings.get(title)
+        if embedding is None:
+            embedding = (await self._embed([title]))[0]
+            embedding = embedding / np.linalg.norm(embedding)
+            self._remember_title_embedding(title, embedding)
+        else:
+            self._title_embeddings.move_to_end(title)
+        return embedding
+    
+    async def _semantic_lookup(self, paper: PaperRecord) -> Optional[Dict[str, Any]]:
+        """Return a cached summary of a near-identical title, re-labelled for this paper."""
+        try:
+            embedding = await self._title_embedding(paper.title)
         except Exception as e:
-            elapsed = time.time() - start_time
-            print(f"  ✗ Error scoring papers ({elapsed:.2f}s): {str(e)}")
-            return papers[:top_k]
+            logger.warning("Title embedding failed: %s", e)
+            return None
+        cached = self.semantic_cache.lookup(embedding)
+        if cached is None:
+            return None
+        # Reuse only the analysis; everything else describes this paper, which
+        # has no PDF of its own downloaded
+        return {
+            "title": paper.title,
+            "authors": paper.author_names,
+            "category": paper.primary_category,
+            "detailed_summary": cached["detailed_summary"],
+            "url": paper.entry_id,
+            "arxiv_id": paper.entry_id,
+            "published_date": paper.published,
+            "pdf_path": None,
+            "pdf_status": "Reused summary of near-identical title",
+            "has_pdf_analysis": False
+        }
+    
+    def _summary_prompt(self, paper: PaperRecord) -> str:
+        """Metadata and instructions shared by the abstract-only and PDF-refined prompts."""
+        return SUMMARY_PROMPT_TEMPLATE.format_map({
+            "title": paper.title,
+            "authors": paper.author_names,
+            "abstract": paper.summary
+        })
+    
+    def _refine_messages(self, paper: PaperRecord, pdf_text: str, draft: Optional[str] = None) -> List[Dict[str, str]]:
+        """Chat messages for the summary that adds the PDF excerpt (and draft, if any) to the shared prompt."""
+        # Append PDF content and the draft after the shared prompt so the
+        # provider can reuse the cached prefix from the draft call
+        draft_text = DRAFT_REFINE_TEMPLATE.format_map({"draft": draft}) if draft else ""
+        prompt = self._summary_prompt(paper) + PDF_EXCERPT_HEADER
+        # Give the PDF excerpt every token the rest of the prompt leaves free
+        pdf_budget = SUMMARY_PROMPT_TOKEN_BUDGET - count_tokens(prompt + draft_text)
+        prompt += trim_to_tokens(pdf_text, pdf_budget) + "\n" + draft_text
+        return [
+            {"role": "system", "content": "You are a research expert who provides detailed paper analysis."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _pdf_path(self, paper: PaperRecord) -> Path:
+        # arXiv ids are unique and filesystem-safe once old-style "archive/number"
+        # ids have their slash replaced
+        pdf_filename = f"{paper.entry_id.split('/abs/')[-1].replace('/', '_')}.pdf"
+        return self.pdf_dir / pdf_filename
     
-    async def detailed_paper_summary(self, paper: Any) -> Dict[str, str]:
-        """Create a detailed summary of a research paper using both metadata and PDF content."""
-        start_time = time.time()
+    def _summary_record(
+        self,
+        paper: PaperRecord,
+        summary_text: str,
+        pdf_path: Path,
+        pdf_status: str,
+        pdf_text: str,
+        elapsed: float
+    ) -> Dict[str, Any]:
+        """The summary dict returned for a paper whose analysis succeeded."""
+        return {
+            "title": paper.title,
+            "authors": paper.author_names,
+            "category": paper.primary_category,
+            "detailed_summary": summary_text,
+            "url": paper.entry_id,
+            "arxiv_id": paper.entry_id,
+            "published_date": paper.published,
+            "pdf_path": str(pdf_path) if pdf_status == "Successfully downloaded" else None,
+            "pdf_status": pdf_status,
+            "has_pdf_analysis": bool(pdf_text.strip()),
+            "processing_time": elapsed
+        }
+    
+    async def _abstract_draft(self, paper: PaperRecord) -> str:
+        """Summarize a paper from its title and abstract alone."""
+        return await self._cached_chat(
+            messages=[
+                {"role": "system", "content": "You are a research expert who provides detailed paper analysis."},
+                {"role": "user", "content": self._summary_prompt(paper)}
+            ],
+            max_tokens=1000,
+            temperature=0.3
+        )
+    
+    async def detailed_paper_summary(
+        self,
+        paper: PaperRecord,
+        draft: Optional[str] = None,
+        on_delta: Optional[Callable[[str], Any]] = None
+    ) -> Dict[str, str]:
+        """
+        Create a detailed summary of a research paper using both metadata and PDF content.
+        An abstract-only draft is written concurrently with the PDF download, unless
+        one is passed in, and then refined with the PDF content. on_delta receives
+        the final summary text as it streams in.
+        """
+        start_time = time.perf_counter()
         
         title = paper.title
-        abstract = paper.summary
-        authors = paper.authors
-        author_names = ', '.join([str(author) for author in authors]) if authors else ''
-        published_date = paper.published if hasattr(paper, 'published') else None
-        arxiv_id = paper.entry_id if hasattr(paper, 'entry_id') else None
+        author_names = paper.author_names
+        published_date = paper.published
+        arxiv_id = paper.entry_id
         
-        # Extract text from PDF asynchronously
-        print(f"  Extracting text from PDF for: {title[:50]}...")
-        pdf_text = await self.extract_pdf_text(paper)
+        pdf_path = self._pdf_path(paper)
         
-        # Create a comprehensive prompt
-        prompt = f"""
-        Title: {title}
-        Authors: {author_names}
-        Abstract: {abstract}
+        cached_summary = await self._semantic_lookup(paper)
+        if cached_summary is not None:
+            elapsed = time.perf_counter() - start_time
+            logger.info("Reused summary of a near-identical title for: %s...", title[:50], extra={"paper_id": arxiv_id})
+            return {**cached_summary, "processing_time": elapsed}
         
-        Additional Content from PDF Introduction:
-        {pdf_text[:2000]}  # Using first 2000 chars of PDF text
+        # Draft the analysis from the abstract while the PDF downloads; the PDF
+        # content then only refines it
+        draft_task = asyncio.create_task(self._abstract_draft(paper)) if draft is None else None
         
-        Please provide a comprehensive analysis of this research paper covering:
-        1. Main objective and motivation (from abstract)
-        2. Key methodology or approach (from PDF content)
-        3. Most significant findings or contributions
-        4. Technical details and implementation insights (from PDF)
-        5. Potential impact and applications
+        logger.info("Extracting text from PDF for: %s...", title[:50], extra={"paper_id": arxiv_id})
+        pdf_text, pdf_status = await self._load_pdf_text(paper, pdf_path, start_time)
         
-        Format the response as:
-        SUMMARY: [200-word detailed summary incorporating PDF content]
-        METHODOLOGY: [Key technical approaches found in the paper]
-        FINDINGS: [Main results and contributions]
-        TECHNICAL_DETAILS: [Important implementation details from the PDF]
-        IMPACT: [Potential applications and significance]
-        """
+        if draft_task is not None:
+            try:
+                draft = await draft_task
+            except Exception as e:
+                logger.warning("Abstract-only draft failed: %s", e, extra={"paper_id": arxiv_id})
         
         try:
-            # Run OpenAI API call in thread pool
-            response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a research expert who provides detailed paper analysis."},
-                        {"role": "user", "content": prompt}
-                    ],
+            if draft and not pdf_text.strip():
+                # Nothing from the PDF to add, so the draft is the summary
+                summary_text = draft
+                if on_delta is not None:
+                    on_delta(draft)
+            else:
+                summary_text = await self._cached_chat(
+                    messages=self._refine_messages(paper, pdf_text, draft),
+                    on_delta=on_delta,
                     max_tokens=1000,
                     temperature=0.3
                 )
-            )
-            
-            summary_text = response.choices[0].message.content.strip()
             
-            # Download PDF for user reference - in thread pool
-            pdf_dir = Path("paper_downloads")
-            pdf_dir.mkdir(exist_ok=True)
+            elapsed = time.perf_counter() - start_time
+            logger.info("Paper summary completed in %.2fs", elapsed, extra={"elapsed_s": elapsed, "paper_id": arxiv_id})
             
-            safe_title = "".join(x for x in title if x.isalnum() or x in (' ', '-', '_'))[:50]
-            pdf_filename = f"{safe_title}.pdf"
-            pdf_path = pdf_dir / pdf_filename
+            summary = self._summary_record(paper, summary_text, pdf_path, pdf_status, pdf_text, elapsed)
             
-            try:
+            # Index the summary for later near-duplicate titles (embedded during lookup)
+            embedding = self._title_embeddings.get(title)
+            if embedding is not None:
                 await asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    paper.download_pdf,
-                    str(pdf_dir),
-                    pdf_filename
+                    self.executor, self.semantic_cache.add, embedding, summary
                 )
-                pdf_status = "Successfully downloaded"
-            except Exception as e:
-                pdf_status = f"Download failed: {str(e)[:50]}..."
-            
-            elapsed = time.time() - start_time
-            print(f"  ✓ Paper summary completed in {elapsed:.2f} seconds")
-            
-            return {
-                "title": title,
-                "authors": author_names,
-                "category": paper.primary_category,
-                "detailed_summary": summary_text,
-                "url": paper.entry_id,
-                "arxiv_id": arxiv_id,
-                "published_date": published_date,
-                "pdf_path": str(pdf_path) if pdf_status == "Successfully downloaded" else None,
-                "pdf_status": pdf_status,
-                "has_pdf_analysis": bool(pdf_text.strip()),
-                "processing_time": elapsed
-            }
+            return summary
         
         except Exception as e:
-            elapsed = time.time() - start_time
-            print(f"  ✗ Error creating detailed summary ({elapsed:.2f}s): {str(e)}")
+            elapsed = time.perf_counter() - start_time
+            logger.error("Error creating detailed summary (%.2fs): %s", elapsed, e, extra={"elapsed_s": elapsed, "paper_id": arxiv_id})
             return {
                 "title": title,
                 "authors": author_names,
@@ -247,19 +738,287 @@ Only output the scores and explanations, nothing else."""
                 "processing_time": elapsed
             }
     
-    async def batch_summarize(self, papers: List[Any], max_papers: int = 1) -> List[Dict[str, str]]:
-        """Select and create detailed summaries for the best papers."""
+    async def _run_chat_batch(
+        self,
+        requests: Dict[str, List[Dict[str, str]]],
+        poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+        max_wait: float = BATCH_MAX_WAIT_SECONDS,
+        on_poll: Optional[Callable[[], Awaitable[Any]]] = None,
+        **kwargs
+    ) -> Dict[str, str]:
+        """
+        Submit chat completions (custom_id -> messages) as one Batch API job, poll
+        until it finishes and return the content of each request that succeeded.
+        A job still running after max_wait seconds is cancelled and returns
+        nothing. on_poll is awaited on every poll, e.g. to keep a claim alive.
+        """
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": self.model, "messages": messages, **kwargs}
+            })
+            for custom_id, messages in requests.items()
+        ]
+        batch_file = await self.client.files.create(
+            file=("summaries.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted batch %s with %d requests", batch.id, len(lines))
+        
+        deadline = time.monotonic() + max_wait
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            if time.monotonic() >= deadline:
+                logger.warning("Batch %s still %s after %ds, cancelling", batch.id, batch.status, max_wait)
+                await self.client.batches.cancel(batch.id)
+                return {}
+            await asyncio.sleep(poll_interval)
+            if on_poll is not None:
+                try:
+                    await on_poll()
+                except Exception as e:
+                    logger.warning("Batch %s poll callback failed: %s", batch.id, e)
+            batch = await self.client.batches.retrieve(batch.id)
+        
+        # An expired batch still has output for the requests it finished
+        if not batch.output_file_id:
+            logger.error("Batch %s ended as %s without output", batch.id, batch.status)
+            return {}
+        output = await self.client.files.content(batch.output_file_id)
+        
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            results[row["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+        logger.info("Batch %s ended as %s with %d/%d results", batch.id, batch.status, len(results), len(lines))
+        return results
+    
+    async def batch_detailed_summaries(
+        self,
+        papers: List[PaperRecord],
+        poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+        on_poll: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Summarize papers like detailed_paper_summary, but send every completion
+        that isn't cached as a single Batch API job - half the price of regular
+        requests, at the cost of waiting for the job. Meant for bulk runs where
+        nobody is waiting; papers the job returns nothing for (including every
+        paper of a job cancelled after BATCH_MAX_WAIT_SECONDS) are summarized
+        individually. on_poll is passed to _run_chat_batch. Results are in the
+        order of papers.
+        """
+        start_time = time.perf_counter()
+        chat_kwargs = {"max_tokens": 1000, "temperature": 0.3}
+        
+        pdf_paths = [self._pdf_path(paper) for paper in papers]
+        pdf_results = await asyncio.gather(*(
+            self._load_pdf_text(paper, pdf_path, start_time)
+            for paper, pdf_path in zip(papers, pdf_paths)
+        ))
+        # One PDF-refined completion per paper, without the abstract-only draft
+        messages_by_id = {
+            paper.entry_id: self._refine_messages(paper, pdf_text)
+            for paper, (pdf_text, _) in zip(papers, pdf_results)
+        }
+        keys = {
+            arxiv_id: self._chat_cache_key(messages, **chat_kwargs)
+            for arxiv_id, messages in messages_by_id.items()
+        }
+        
+        contents = {}
+        for arxiv_id, key in keys.items():
+            try:
+                cached = await get_cached_llm_response(key)
+            except Exception as e:
+                logger.warning("LLM cache lookup failed: %s", e)
+                cached = None
+            if cached is not None:
+                contents[arxiv_id] = cached
+        
+        pending = {arxiv_id: messages for arxiv_id, messages in messages_by_id.items() if arxiv_id not in contents}
+        if pending:
+            try:
+                results = await self._run_chat_batch(pending, poll_interval=poll_interval, on_poll=on_poll, **chat_kwargs)
+            except Exception as e:
+                logger.error("Batch summarization failed: %s", e)
+                results = {}
+            for arxiv_id, content in results.items():
+                contents[arxiv_id] = content
+                try:
+                    await store_cached_llm_response(keys[arxiv_id], self.model, content)
+                except Exception as e:
+                    logger.warning("LLM cache store failed: %s", e)
+        
+        elapsed = time.perf_counter() - start_time
+        
+        async def finish(paper, pdf_path, pdf_text, pdf_status):
+            content = contents.get(paper.entry_id)
+            if content is None:
+                return await self.detailed_paper_summary(paper)
+            return self._summary_record(paper, content, pdf_path, pdf_status, pdf_text, elapsed)
+        
+        return await asyncio.gather(*(
+            finish(paper, pdf_path, pdf_text, pdf_status)
+            for paper, pdf_path, (pdf_text, pdf_status) in zip(papers, pdf_paths, pdf_results)
+        ))
+    
+    async def stream_paper_summary(self, paper: PaperRecord) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Summarize a paper, yielding {"delta": text} fragments as the summary is
+        generated and finally {"summary": summary_dict}.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self.detailed_paper_summary(paper, on_delta=queue.put_nowait))
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter in done:
+                yield {"delta": getter.result()}
+                continue
+            getter.cancel()
+            break
+        while not queue.empty():
+            yield {"delta": queue.get_nowait()}
+        yield {"summary": task.result()}
+    
+    async def select_and_summarize(self, papers: List[PaperRecord], max_papers: int = 1) -> List[Dict[str, Any]]:
+        """
+        Pick the most interesting papers and summarize them from their abstracts
+        in one structured call, instead of scoring and summarizing separately.
+        
+        Returns:
+            Summary dicts shaped like detailed_paper_summary's, without PDF analysis
+        """
+        start_time = time.perf_counter()
+        papers_text = "\n\n".join(
+            f"[{i}] Title: {paper.title}\nAbstract: {paper.summary}"
+            for i, paper in enumerate(papers)
+        )
+        prompt = f"""Below are research papers with their abstracts. Pick the {max_papers} most
+innovative and impactful of them and, for each one you pick, write:
+- summary: a 200-word detailed summary
+- methodology: key technical approaches
+- findings: main results and contributions
+- technical_details: important implementation details
+- impact: potential applications and significance
+
+Papers:
+{papers_text}"""
+        
+        section_schema = {
+            "type": "object",
+            "properties": {name: {"type": "string"} for name in SUMMARY_SECTIONS},
+            "required": list(SUMMARY_SECTIONS),
+            "additionalProperties": False
+        }
+        schema = {
+            "type": "object",
+            "properties": {
+                "selected": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"index": {"type": "integer"}, "sections": section_schema},
+                        "required": ["index", "sections"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["selected"],
+            "additionalProperties": False
+        }
+        
+        content = await self._cached_chat(
+            messages=[
+                {"role": "system", "content": "You are a research expert who evaluates paper significance and provides detailed paper analysis."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=SELECT_SUMMARY_TOKENS_PER_PAPER * max_papers,
+            temperature=0.3,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "selected_summaries", "schema": schema, "strict": True}
+            }
+        )
+        
+        summaries = []
+        seen = set()
+        for item in json.loads(content)["selected"]:
+            index = item["index"]
+            if not 0 <= index < len(papers) or index in seen:
+                continue
+            seen.add(index)
+            paper = papers[index]
+            summaries.append({
+                "title": paper.title,
+                "authors": paper.author_names,
+                "category": paper.primary_category,
+                # Same SECTION: text layout detailed_paper_summary produces
+                "detailed_summary": "\n".join(
+                    f"{name.upper()}: {item['sections'][name]}" for name in SUMMARY_SECTIONS
+                ),
+                "url": paper.entry_id,
+                "arxiv_id": paper.entry_id,
+                "published_date": paper.published,
+                "pdf_path": None,
+                "pdf_status": "Not downloaded",
+                "has_pdf_analysis": False,
+                "processing_time": time.perf_counter() - start_time
+            })
+            if len(summaries) >= max_papers:
+                break
+        
+        elapsed = time.perf_counter() - start_time
+        logger.info("Selected and summarized %d papers in %.2fs", len(summaries), elapsed, extra={"elapsed_s": elapsed})
+        return summaries
+    
+    async def batch_summarize(
+        self,
+        papers: List[PaperRecord],
+        max_papers: int = 1,
+        refine_with_pdf: bool = True
+    ) -> List[Dict[str, str]]:
+        """
+        Select and create detailed summaries for the best papers.
+        
+        Selection and abstract-based summaries come from a single call; with
+        refine_with_pdf (the default), each chosen paper's PDF is then fetched
+        and the draft refined with its content. Without it, the summaries are
+        abstract-only. If the combined call's reply can't be parsed, papers are
+        scored and summarized separately instead.
+        """
         if not papers:
             return []
-            
-        # First, score and select the most interesting papers
-        selected_papers = await self.score_papers_by_title(papers, top_k=max_papers)
         
-        # Process papers concurrently and save each one as it completes
-        tasks = [self.detailed_paper_summary(paper) for paper in selected_papers]
-        summaries = await asyncio.gather(*tasks)
+        try:
+            summaries = await self.select_and_summarize(papers, max_papers=max_papers)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Combined select-and-summarize reply unusable, scoring separately: %s", e)
+            selected = await self.score_papers_multicategory({"papers": papers}, top_k=max_papers)
+            return await asyncio.gather(*(
+                self.detailed_paper_summary(paper) for paper in selected.get("papers", [])
+            ))
+        if not refine_with_pdf:
+            return summaries
         
-        return summaries
+        papers_by_id = {paper.entry_id: paper for paper in papers}
+        tasks = [
+            self.detailed_paper_summary(papers_by_id[summary["arxiv_id"]], draft=summary["detailed_summary"])
+            for summary in summaries
+        ]
+        return await asyncio.gather(*tasks)
     
     async def generate_paper_summary(self, title: str, authors: str, abstract: str, url: str) -> str:
         """Generate a comprehensive summary of a paper based on its metadata."""
@@ -283,23 +1042,17 @@ Only output the scores and explanations, nothing else."""
         """
         
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a research expert who synthesizes academic papers into accessible summaries."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=1500,
-                    temperature=0.3
-                )
+            return await self._cached_chat(
+                messages=[
+                    {"role": "system", "content": "You are a research expert who synthesizes academic papers into accessible summaries."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=1500,
+                temperature=0.3
             )
             
-            return response.choices[0].message.content.strip()
-            
         except Exception as e:
-            print(f"Error generating paper summary: {str(e)}")
+            logger.error("Error generating paper summary: %s", e)
             return f"Error generating summary: {str(e)}"
             
     async def generate_pdf_summary(self, title: str, authors: str, pdf_text: str) -> str:
@@ -314,7 +1067,7 @@ Only output the scores and explanations, nothing else."""
         Returns:
             A detailed summary of the paper
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Create a comprehensive prompt using the PDF text
         prompt = f"""
@@ -338,28 +1091,21 @@ Only output the scores and explanations, nothing else."""
         """
         
         try:
-            # Run OpenAI API call in thread pool
-            response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a research expert who analyzes academic papers in detail."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=2000,
-                    temperature=0.3
-                )
+            summary_text = await self._cached_chat(
+                messages=[
+                    {"role": "system", "content": "You are a research expert who analyzes academic papers in detail."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=2000,
+                temperature=0.3
             )
             
-            summary_text = response.choices[0].message.content.strip()
-            
-            elapsed = time.time() - start_time
-            print(f"  ✓ PDF summary generation completed in {elapsed:.2f} seconds")
+            elapsed = time.perf_counter() - start_time
+            logger.info("PDF summary generation completed in %.2fs", elapsed, extra={"elapsed_s": elapsed})
             
             return summary_text
             
         except Exception as e:
-            elapsed = time.time() - start_time
-            print(f"  ✗ Error generating PDF summary ({elapsed:.2f}s): {str(e)}")
+            elapsed = time.perf_counter() - start_time
+            logger.error("Error generating PDF summary (%.2fs): %s", elapsed, e, extra={"elapsed_s": elapsed})
             return f"Error generating PDF summary: {str(e)}"
\ No newline at end of file
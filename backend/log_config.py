@@ -0,0 +1,28 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_listener = None
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route log records through a QueueHandler so coroutines only enqueue them;
+    a QueueListener thread does the actual (blocking) stream writes.
+    Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -2,31 +2,79 @@ import os
 import argparse
 import datetime
 import asyncio
-from typing import Dict, List, Any, Set
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+import functools
+import hashlib
+import random
+from typing import Dict, List, Any, Optional, Set
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import uvicorn
+import orjson
 import re # For slugify
 from bson import ObjectId
 import time
-import urllib.request
-from PyPDF2 import PdfReader
 import io
 import shutil
+import httpx
 import arxiv  # Import the arxiv package directly
 
 # Debug: Verify arxiv module is correctly imported
 print(f"ArXiv module imported successfully. Has Search: {hasattr(arxiv, 'Search')}")
 
-from arxiv_fetcher import ArxivFetcher
-from llm import LLMSummarizer
-from database import paper_details_collection
+from arxiv_fetcher import ArxivFetcher, CATEGORIES, to_paper_record
+from llm import LLMSummarizer, get_pdf_pool
+from pdf_text import extract_pdf_page_range, pdf_page_count
+from database import (
+    paper_details_collection,
+    init_database,
+    close_database,
+    list_papers,
+    LIST_PROJECTION,
+    count_papers_by_category,
+    count_papers_for_status,
+    paper_upsert,
+    insert_paper_if_absent,
+    claim_generation,
+    release_generation,
+    refresh_generation,
+    claimed_categories,
+    AsyncBulkWriter
+)
+from http_client import close_http_client, get_http_client
+from log_config import setup_logging
+
+setup_logging()
 
 app = FastAPI()
 api_key = os.getenv("OPENAI_API_KEY")
 
-# Global variable to track if generation is in progress for specific categories
-generation_in_progress: Dict[str, bool] = {}
+@app.on_event("startup")
+async def startup_database():
+    """Create the MongoDB indexes and the app-wide components before serving requests."""
+    await init_database()
+    app.state.arxiv_fetcher = ArxivFetcher()
+    app.state.llm_summarizer = None  # Created on first use; needs the OpenAI key
+
+def get_arxiv_fetcher(request: Request) -> ArxivFetcher:
+    """Dependency returning the app-wide ArxivFetcher."""
+    return request.app.state.arxiv_fetcher
+
+def get_llm_summarizer() -> LLMSummarizer:
+    """
+    Return the app-wide LLMSummarizer, creating it on first use so its OpenAI
+    client and semaphores are shared by every request.
+    """
+    if getattr(app.state, "llm_summarizer", None) is None:
+        app.state.llm_summarizer = LLMSummarizer(api_key=api_key)
+    return app.state.llm_summarizer
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Finish background writes, then release the shared HTTP connection pool and the MongoDB client."""
+    await flush_pending_writes()
+    await close_http_client()
+    await close_database()
 
 # Add CORSMiddleware
 app.add_middleware(
@@ -37,28 +85,154 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class _SlugTable(dict):
+    """str.translate table mapping whitespace to '-' and dropping anything but [a-z0-9-]."""
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        if char.isspace():
+            value = "-"
+        elif char in "abcdefghijklmnopqrstuvwxyz0123456789-":
+            value = codepoint
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+_SLUG_TABLE = _SlugTable()
+_SLUG_DASHES_RE = re.compile(r'-{2,}')
+
+@functools.lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """Convert text into a URL-friendly slug."""
-    text = text.lower()
-    text = re.sub(r'\s+', '-', text)
-    text = re.sub(r'[^a-z0-9\-]', '', text)
-    text = re.sub(r'-+', '-', text)
-    return text.strip('-')
+    text = text.lower().translate(_SLUG_TABLE)
+    return _SLUG_DASHES_RE.sub('-', text).strip('-')
 
-def serialize_mongo_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
-    """Helper function to serialize MongoDB document."""
-    if doc is None:
+def encode_mongo_value(value: Any) -> Any:
+    """orjson fallback for the BSON values it can't serialize natively."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def json_response(payload: Any) -> Response:
+    """Encode raw Mongo documents straight to a JSON response with orjson."""
+    return Response(content=orjson.dumps(payload, default=encode_mongo_value), media_type="application/json")
+
+# Keyset pagination: a page starts after the (sort value, _id) of the previous
+# page's last paper, so deep pages cost no more than the first one
+DATE_SORT_FIELDS = ("published_date", "generation_date")
+
+def keyset_filter(sort_by: str, sort_direction: int, after: str, after_id: str) -> Dict[str, Any]:
+    """
+    Query matching the papers that sort after the cursor (after, after_id).
+    Raises a 400 for a cursor that next_cursor couldn't have produced.
+    """
+    if sort_by in DATE_SORT_FIELDS:
+        try:
+            after = datetime.datetime.fromisoformat(after)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: after must be an ISO date for {sort_by}")
+    if not ObjectId.is_valid(after_id):
+        raise HTTPException(status_code=400, detail="Invalid cursor: after_id must be a paper id")
+    after_id = ObjectId(after_id)
+    operator = "$lt" if sort_direction == -1 else "$gt"
+    return {"$or": [
+        {sort_by: {operator: after}},
+        {sort_by: after, "_id": {operator: after_id}}
+    ]}
+
+def next_cursor(papers: List[Dict[str, Any]], sort_by: str, per_page: int):
+    """Cursor params for the page after papers, or None on the last page."""
+    if len(papers) < per_page or not papers:
         return None
-        
-    serialized = {}
-    for key, value in doc.items():
-        if isinstance(value, ObjectId):
-            serialized[key] = str(value)
-        elif isinstance(value, datetime.datetime):
-            serialized[key] = value.isoformat()
-        else:
-            serialized[key] = value
-    return serialized
+    last = papers[-1]
+    return {"after": last.get(sort_by), "after_id": str(last["_id"])}
+
+def serialize_paper_summary(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Serialize a paper read with PAPER_SUMMARY_PROJECTION. The fields are known,
+    so this reads them directly instead of type-checking every value.
+    """
+    published = doc.get("published_date")
+    return {
+        "title": doc.get("title"),
+        "slug": doc.get("slug"),
+        "arxiv_id": doc.get("arxiv_id"),
+        "category_code": doc.get("category_code"),
+        "published_date": published.isoformat() if isinstance(published, datetime.datetime) else published
+    }
+
+# Read endpoints serve their serialized response from memory for a short while;
+# saving papers bumps the generation, which retires every cached entry
+RESPONSE_CACHE_TTL_SECONDS = 60
+RESPONSE_CACHE_MAX_ENTRIES = 512
+# Generation status changes without papers being saved, so it is only reused briefly
+STATUS_CACHE_TTL_SECONDS = 5
+_response_cache: Dict[tuple, tuple] = {}
+_response_cache_generation = 0
+
+def invalidate_response_cache():
+    """Make cached responses stale after the stored papers change."""
+    global _response_cache_generation
+    _response_cache_generation += 1
+    _response_cache.clear()
+
+def response_cache(ttl: int = RESPONSE_CACHE_TTL_SECONDS):
+    """
+    Memoize a GET endpoint's JSON body by its parameters for ttl seconds and
+    tag it with an ETag, answering a matching If-None-Match with 304. The
+    endpoint must declare a request: Request parameter.
+    """
+    def decorator(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(**kwargs):
+            request = kwargs["request"]
+            key = (
+                endpoint.__name__,
+                tuple(sorted((name, value) for name, value in kwargs.items() if name != "request")),
+                _response_cache_generation
+            )
+            now = time.monotonic()
+            entry = _response_cache.get(key)
+            if entry is None or entry[0] < now:
+                # Raw Mongo docs are encoded directly; orjson handles datetimes itself
+                body = orjson.dumps(await endpoint(**kwargs), default=encode_mongo_value)
+                etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                entry = (now + ttl, body, etag)
+                if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    _response_cache.pop(next(iter(_response_cache)))
+                _response_cache[key] = entry
+            
+            _, body, etag = entry
+            # Clients and proxies must revalidate every time, so newly generated
+            # papers show up immediately; unchanged bodies still cost only a 304
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+            if_none_match = request.headers.get("if-none-match", "")
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+        return wrapper
+    return decorator
+
+async def filter_new_papers(papers: List[Any]) -> List[Any]:
+    """Drop papers that have already been processed and stored."""
+    # Only look up the candidates' ids; the unique arxiv_id index answers this
+    # without scanning the collection
+    candidate_ids = [paper.entry_id for paper in papers]
+    if not candidate_ids:
+        return []
+    existing_paper_ids = set(await paper_details_collection.distinct(
+        "arxiv_id", {"arxiv_id": {"$in": candidate_ids}}
+    ))
+    
+    return [
+        paper for paper in papers 
+        if paper.entry_id not in existing_paper_ids
+    ]
+
+# Papers of one category summarized at a time; with 3 categories in parallel
+# this keeps the OpenAI request rate steady instead of bursting per category
+PAPER_CONCURRENCY_PER_CATEGORY = 5
 
 async def process_category(
     category: str,
@@ -66,47 +240,37 @@ async def process_category(
     arxiv_fetcher: ArxivFetcher,
     llm_summarizer: LLMSummarizer,
     current_date: str,
-    max_papers_per_category: int
+    claim_owner: ObjectId,
+    use_batch_api: bool = False
 ) -> List[Dict[str, Any]]:
-    """Process a single category's papers in parallel."""
+    """
+    Summarize and save a single category's selected papers in parallel.
+    claim_owner is the token from claim_generation, used to release the claim.
+    With use_batch_api, the summaries come from one OpenAI Batch API job instead.
+    Papers are queued on the category's own bulk writer as soon as they are
+    summarized, and flushed before returning, so a failed write is reported
+    by the category it belongs to.
+    """
+    writer = AsyncBulkWriter(paper_details_collection)
     try:
         category_name = arxiv_fetcher.get_category_name(category)
         category_s = slugify(category_name)
         
         if not papers:
-            print(f"No papers found for {category} - {category_name}.")
+            print(f"No papers selected for {category} - {category_name}.")
             return []
             
-        print(f"\nProcessing papers from {category} ({category_name})...")
-        
-        # Get list of previously processed paper IDs
-        existing_paper_ids = set()
-        cursor = paper_details_collection.find({}, {"arxiv_id": 1})
-        for doc in cursor:
-            if doc.get("arxiv_id"):
-                existing_paper_ids.add(doc["arxiv_id"])
-        
-        # Filter out previously processed papers
-        new_papers = [
-            paper for paper in papers 
-            if hasattr(paper, 'entry_id') and paper.entry_id not in existing_paper_ids
-        ]
+        print(f"\nProcessing {len(papers)} selected papers from {category} ({category_name})...")
         
-        if not new_papers:
-            print(f"  No new unprocessed papers found for {category}.")
-            return []
-            
-        print(f"  Found {len(new_papers)} new papers, selecting the most interesting ones...")
+        paper_semaphore = asyncio.Semaphore(PAPER_CONCURRENCY_PER_CATEGORY)
         
-        # Score and select papers
-        selected_papers = await llm_summarizer.score_papers_by_title(new_papers, top_k=max_papers_per_category)
-        processed_papers = []
-
-        # Process each paper concurrently and save immediately
-        async def process_and_save_paper(paper):
+        # Process each paper concurrently
+        async def process_and_save_paper(paper, paper_summary=None):
             try:
                 start_time = time.time()
-                paper_summary = await llm_summarizer.detailed_paper_summary(paper)
+                if paper_summary is None:
+                    async with paper_semaphore:
+                        paper_summary = await llm_summarizer.detailed_paper_summary(paper)
                 
                 if not paper_summary or not paper_summary.get('title'):
                     print("  Skipping an empty or untitled paper summary.")
@@ -127,23 +291,15 @@ async def process_category(
                     "pdf_status": paper_summary.get('pdf_status'),
                     "has_pdf_analysis": paper_summary.get('has_pdf_analysis'),
                     "summary_sections": paper_summary.get('detailed_summary'),
-                    "generation_date": datetime.datetime.utcnow(),
+                    "generation_date": datetime.datetime.now(datetime.timezone.utc),
                     "processed_date": current_date,
                     "processing_time": paper_summary.get('processing_time')
                 }
                 
                 if paper_detail_doc.get("arxiv_id"):
-                    # Save to MongoDB immediately after processing
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: paper_details_collection.update_one(
-                            {"arxiv_id": paper_detail_doc["arxiv_id"]},
-                            {"$set": paper_detail_doc},
-                            upsert=True
-                        )
-                    )
+                    await writer.enqueue(paper_upsert(paper_detail_doc))
                     elapsed = time.time() - start_time
-                    print(f"  ✓ Processed and saved paper: \"{paper_summary['title'][:50]}...\" in {elapsed:.2f} seconds")
+                    print(f"  ✓ Processed paper: \"{paper_summary['title'][:50]}...\" in {elapsed:.2f} seconds")
                     return paper_detail_doc
                 else:
                     print(f"  ! Skipping paper due to missing arxiv_id: {paper_summary['title']}")
@@ -154,11 +310,32 @@ async def process_category(
                 return None
 
         # Process all selected papers concurrently
-        processing_tasks = [process_and_save_paper(paper) for paper in selected_papers]
-        processed_results = await asyncio.gather(*processing_tasks)
+        if use_batch_api:
+            # Keep the claim from expiring while the job is queued at OpenAI
+            summaries = await llm_summarizer.batch_detailed_summaries(
+                papers,
+                on_poll=lambda: refresh_generation(category, current_date, claim_owner)
+            )
+            processing_tasks = [
+                process_and_save_paper(paper, summary)
+                for paper, summary in zip(papers, summaries)
+            ]
+        else:
+            processing_tasks = [process_and_save_paper(paper) for paper in papers]
+        
+        # Collect papers as they finish (each is already queued for saving);
+        # None results are errors or skipped papers
+        processed_papers = []
+        for finished in asyncio.as_completed(processing_tasks):
+            paper_detail_doc = await finished
+            if paper_detail_doc is not None:
+                processed_papers.append(paper_detail_doc)
         
-        # Filter out None results from errors
-        processed_papers = [paper for paper in processed_results if paper is not None]
+        # Papers were queued in batches as they finished; write whatever is left
+        if processed_papers:
+            await writer.flush()
+            invalidate_response_cache()
+            print(f"  ✓ Saved {len(processed_papers)} papers for {category}")
         
         return processed_papers
             
@@ -166,20 +343,33 @@ async def process_category(
         print(f"  ✗ Error processing category {category}: {str(e)}")
         return []
     finally:
-        # Clear the generation in progress flag for this category
-        generation_in_progress[category] = False
+        # Let the category be generated again as soon as it is done
+        await release_generation(category, current_date, claim_owner)
 
 async def run_arxiv_summarizer_async(
     current_date: str,
-    categories_to_process: Set[str],
+    categories_to_process: Dict[str, ObjectId],
     api_key: str = None,
     max_papers_per_category: int = 1,
+    use_batch_api: bool = False,
+    arxiv_fetcher: ArxivFetcher = None,
+    llm_summarizer: LLMSummarizer = None,
 ) -> List[Dict[str, Any]]:
-    """Async version of run_arxiv_summarizer that processes categories in parallel."""
+    """
+    Async version of run_arxiv_summarizer that processes categories in parallel.
+    use_batch_api summarizes each category through the OpenAI Batch API, for
+    runs where nobody is waiting on the results. Components that aren't
+    passed in are created for this run.
+    
+    The caller claims categories_to_process, which maps each category to its
+    claim_generation owner token; the claims are released as each category finishes.
+    """
     try:
         # Initialize components
-        arxiv_fetcher = ArxivFetcher()
-        llm_summarizer = LLMSummarizer(api_key=api_key)
+        if arxiv_fetcher is None:
+            arxiv_fetcher = ArxivFetcher()
+        if llm_summarizer is None:
+            llm_summarizer = LLMSummarizer(api_key=api_key)
         
         # Create a semaphore to limit concurrent processing
         semaphore = asyncio.Semaphore(3)  # Limit to 3 concurrent categories
@@ -187,39 +377,52 @@ async def run_arxiv_summarizer_async(
         async def process_category_with_semaphore(category: str, papers: List[Any]) -> List[Dict[str, Any]]:
             async with semaphore:
                 try:
-                    generation_in_progress[category] = True
                     return await process_category(
                         category=category,
                         papers=papers,
                         arxiv_fetcher=arxiv_fetcher,
                         llm_summarizer=llm_summarizer,
                         current_date=current_date,
-                        max_papers_per_category=max_papers_per_category
+                        claim_owner=categories_to_process[category],
+                        use_batch_api=use_batch_api
                     )
                 except Exception as e:
                     print(f"Error processing category {category}: {str(e)}")
                     return []
-                finally:
-                    generation_in_progress[category] = False
         
-        # Fetch papers only for categories that need processing
-        category_papers = {}
-        for category in categories_to_process:
-            try:
-                papers = arxiv_fetcher.fetch_papers_by_category(category, max_papers_per_category * 3)
-                if papers:
-                    category_papers[category] = papers
-            except Exception as e:
-                print(f"Error fetching papers for category {category}: {str(e)}")
-                generation_in_progress[category] = False
+        # Fetch papers only for categories that need processing, all at once
+        fetched = await arxiv_fetcher.fetch_categories(categories_to_process, max_papers_per_category * 3)
+        category_papers = {
+            category: [to_paper_record(paper) for paper in papers]
+            for category, papers in fetched.items()
+            if papers
+        }
+        
+        # Filter out previously processed papers, with one lookup for every category
+        all_papers = [paper for papers in category_papers.values() for paper in papers]
+        new_paper_ids = {paper.entry_id for paper in await filter_new_papers(all_papers)}
+        new_papers_by_category = {}
+        for category, papers in category_papers.items():
+            new_papers = [paper for paper in papers if paper.entry_id in new_paper_ids]
+            if new_papers:
+                print(f"  Found {len(new_papers)} new papers for {category}")
+                new_papers_by_category[category] = new_papers
+            else:
+                print(f"  No new unprocessed papers found for {category}.")
         
-        if not category_papers:
+        if not new_papers_by_category:
             return []
         
+        # Score the titles of every category in a single LLM call
+        selected_by_category = await llm_summarizer.score_papers_multicategory(
+            new_papers_by_category,
+            top_k=max_papers_per_category
+        )
+        
         # Process categories in parallel with resource limits
         tasks = [
             process_category_with_semaphore(category, papers)
-            for category, papers in category_papers.items()
+            for category, papers in selected_by_category.items()
         ]
         
         # Wait for all tasks to complete and flatten the results
@@ -237,101 +440,187 @@ async def run_arxiv_summarizer_async(
         
     except Exception as e:
         print(f"Error in run_arxiv_summarizer_async: {str(e)}")
-        # Clean up all generation flags
-        for category in categories_to_process:
-            generation_in_progress[category] = False
         return []
+    finally:
+        # Release every claim, including categories that never reached processing
+        await release_generations(categories_to_process, current_date)
+
+async def category_generation_states(categories_to_check, today_date_str: str, categories_to_process: Dict[str, ObjectId], now_iso: str):
+    """
+    Yield (category, generation status, today's papers) for each category in turn.
+    Categories without papers today are claimed and added to categories_to_process
+    with their owner token.
+    now_iso is the request's timestamp, stamped on every status.
+    """
+    running = await claimed_categories(today_date_str)
+    
+    for cat in categories_to_check:
+        # Get current generation status
+        is_generating = cat in running
+        status = {
+            "status": "in_progress" if is_generating else "pending",
+            "last_updated": now_iso
+        }
+        
+        # Skip if generation is already in progress for this category
+        if is_generating:
+            yield cat, status, None
+            continue
+            
+        # Check if we have papers for this category today
+        cat_papers = await list_papers(cat, processed_date=today_date_str)
+        
+        if cat_papers:
+            status["status"] = "completed"
+        else:
+            owner = await claim_generation(cat, today_date_str)
+            if owner is not None:
+                categories_to_process[cat] = owner
+                status["status"] = "starting"
+            else:
+                # A concurrent request claimed it between our check and now
+                status["status"] = "in_progress"
+        yield cat, status, cat_papers or None
+
+# Strong references to fire-and-forget tasks, so they aren't garbage collected mid-run
+_background_tasks: Set[asyncio.Task] = set()
+
+def spawn_background(coro) -> asyncio.Task:
+    """Run coro as a task that outlives the request which started it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+async def release_generations(claims: Dict[str, ObjectId], date: str):
+    """Release category -> owner claims, logging failures instead of raising."""
+    for category, owner in claims.items():
+        try:
+            await release_generation(category, date, owner)
+        except Exception as e:
+            print(f"Error releasing generation claim for {category}: {str(e)}")
+
+def sse_event(data: Any, event: str = None) -> str:
+    """Format one Server-Sent Events message."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {orjson.dumps(data, default=encode_mongo_value).decode()}\n\n"
 
 @app.get("/api/generate")
-async def generate_summaries(background_tasks: BackgroundTasks, category: str = None, max_papers: int = 1):
+async def generate_summaries(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    category: str = None,
+    max_papers: int = 1,
+    arxiv_fetcher: ArxivFetcher = Depends(get_arxiv_fetcher)
+):
     """
     Endpoint to generate paper summaries in parallel. Only runs the generation for missing categories.
     For subsequent requests on the same day, it returns cached results from MongoDB.
+    
+    Clients that accept text/event-stream (e.g. EventSource) get one event per
+    category as soon as it is looked up, then a "complete" event; everyone
+    else gets the whole result as one JSON object.
     """
-    try:
-        today_date_str = datetime.datetime.now().strftime("%Y-%m-%d")
-        arxiv_fetcher = ArxivFetcher()
-        
-        # If category is specified, only check/generate for that category
-        categories_to_check = [category] if category else arxiv_fetcher.categories.keys()
+    # One clock reading per request; processed_date stays in local time
+    now = datetime.datetime.now(datetime.timezone.utc)
+    now_iso = now.isoformat()
+    today_date_str = now.astimezone().strftime("%Y-%m-%d")
+    
+    # If category is specified, only check/generate for that category
+    categories_to_check = [category] if category else arxiv_fetcher.categories.keys()
+    
+    # Filled with the categories that need generation as they are claimed
+    categories_to_process = {}
+    states = category_generation_states(categories_to_check, today_date_str, categories_to_process, now_iso)
+    
+    def generation_run():
+        return run_arxiv_summarizer_async(
+            current_date=today_date_str,
+            categories_to_process=categories_to_process,
+            api_key=api_key,
+            max_papers_per_category=max_papers,
+            arxiv_fetcher=arxiv_fetcher,
+            llm_summarizer=get_llm_summarizer()
+        )
+    
+    def release_claims():
+        """Release our claims when no run was scheduled to release them."""
+        if categories_to_process:
+            # Spawned rather than awaited: this also runs while the request is
+            # being cancelled, when any await would be interrupted again
+            spawn_background(release_generations(dict(categories_to_process), today_date_str))
+    
+    if "text/event-stream" in request.headers.get("accept", ""):
+        async def event_stream():
+            scheduled = False
+            try:
+                async for cat, status, papers in states:
+                    yield sse_event({"category": cat, "generation_status": status, "existing_papers": papers})
+                # Start the run now rather than as the response's background
+                # task, which never runs if the client disconnects
+                if categories_to_process:
+                    spawn_background(generation_run())
+                scheduled = True
+                yield sse_event({
+                    "categories_processing": list(categories_to_process),
+                    "timestamp": now_iso
+                }, event="complete")
+            except Exception as e:
+                yield sse_event({"detail": f"Error generating summaries: {str(e)}"}, event="error")
+            finally:
+                # Covers errors as well as disconnects (GeneratorExit/CancelledError)
+                if not scheduled:
+                    release_claims()
         
-        # Check which categories need generation
-        categories_to_process = set()
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+    
+    scheduled = False
+    try:
         existing_papers = {}
         generation_status = {}
-        
-        for cat in categories_to_check:
-            # Get current generation status
-            is_generating = generation_in_progress.get(cat, False)
-            generation_status[cat] = {
-                "status": "in_progress" if is_generating else "pending",
-                "last_updated": datetime.datetime.now().isoformat()
-            }
-            
-            # Skip if generation is already in progress for this category
-            if is_generating:
-                continue
-                
-            # Check if we have papers for this category today
-            cat_papers = list(paper_details_collection.find({
-                "category_code": cat,
-                "processed_date": today_date_str
-            }))
-            
-            if cat_papers:
-                existing_papers[cat] = [serialize_mongo_doc(paper) for paper in cat_papers]
-                generation_status[cat]["status"] = "completed"
-            else:
-                categories_to_process.add(cat)
-                generation_in_progress[cat] = True
-                generation_status[cat]["status"] = "starting"
+        async for cat, status, papers in states:
+            generation_status[cat] = status
+            if papers:
+                existing_papers[cat] = [serialize_paper_summary(paper) for paper in papers]
         
         # Start background processing for categories that need it
         if categories_to_process:
-            background_tasks.add_task(
-                run_arxiv_summarizer_async,
-                current_date=today_date_str,
-                categories_to_process=categories_to_process,
-                api_key=api_key,
-                max_papers_per_category=max_papers
-            )
+            background_tasks.add_task(generation_run)
+        scheduled = True
         
         # Prepare response with existing papers and generation status
         response = {
             "existing_papers": existing_papers,
             "generation_status": generation_status,
             "categories_processing": list(categories_to_process),
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
         return response
         
     except Exception as e:
-        # Clean up generation flags in case of error
-        for cat in categories_to_process:
-            generation_in_progress[cat] = False
         raise HTTPException(
             status_code=500,
             detail=f"Error generating summaries: {str(e)}"
         )
+    finally:
+        if not scheduled:
+            release_claims()
 
 @app.get("/api/categories")
-async def get_categories():
+@response_cache()
+async def get_categories(request: Request):
     """Get all available categories."""
     try:
-        arxiv_fetcher = ArxivFetcher()
+        # Paper counts for every category in one round-trip
+        counts = await count_papers_by_category()
         categories = []
-        for code, name in arxiv_fetcher.categories.items():
-            # Get paper count for this category
-            count = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: paper_details_collection.count_documents({"category_code": code})
-            )
+        for code, name in CATEGORIES.items():
             categories.append({
                 "code": code,
                 "name": name,
                 "slug": slugify(name),
-                "paper_count": count
+                "paper_count": counts.get(code, 0)
             })
         return categories
     except Exception as e:
@@ -341,43 +630,51 @@ async def get_categories():
         )
 
 @app.get("/api/category/{category_slug}")
-async def get_papers_by_category(category_slug: str, date: str = None, page: int = 1, per_page: int = 10):
-    """Get papers for a specific category, optionally filtered by date."""
+@response_cache()
+async def get_papers_by_category(
+    request: Request,
+    category_slug: str,
+    date: str = None,
+    page: int = 1,
+    per_page: int = 10,
+    after: str = None,
+    after_id: str = None
+):
+    """
+    Get papers for a specific category, optionally filtered by date.
+    Pass a response's next_cursor as after/after_id to fetch the following
+    page without skipping; page is used otherwise.
+    """
     try:
         query = {"category_slug": category_slug}
         if date:
             query["processed_date"] = date
+        use_keyset = after is not None and after_id is not None
         
         # Get total count for pagination
-        total_count = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: paper_details_collection.count_documents(query)
-        )
-        
-        # Calculate skip for pagination
-        skip = (page - 1) * per_page
-        
-        # Fetch papers with pagination
-        papers = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: list(
-                paper_details_collection.find(query)
-                .sort("published_date", -1)
-                .skip(skip)
-                .limit(per_page)
-            )
-        )
-        
-        # Serialize MongoDB documents
-        serialized_papers = [serialize_mongo_doc(paper) for paper in papers]
-                
+        total_count = await paper_details_collection.count_documents(query)
+        
+        # Fetch papers with pagination; _id breaks ties in published_date
+        cursor = paper_details_collection.find(
+            {"$and": [query, keyset_filter("published_date", -1, after, after_id)]} if use_keyset else query,
+            LIST_PROJECTION
+        ).sort([("published_date", -1), ("_id", -1)])
+        if not use_keyset:
+            # Calculate skip for pagination
+            cursor = cursor.skip((page - 1) * per_page)
+        papers = await cursor.limit(per_page).to_list(length=per_page)
+        
+        # response_cache serializes the raw documents
         return {
-            "papers": serialized_papers,
+            "papers": papers,
             "total": total_count,
             "page": page,
             "per_page": per_page,
-            "total_pages": (total_count + per_page - 1) // per_page
+            "total_pages": (total_count + per_page - 1) // per_page,
+            "next_cursor": next_cursor(papers, "published_date", per_page)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -385,15 +682,14 @@ async def get_papers_by_category(category_slug: str, date: str = None, page: int
         )
 
 @app.get("/api/blog/{paper_slug}")
-async def get_paper_by_slug(paper_slug: str):
+@response_cache()
+async def get_paper_by_slug(request: Request, paper_slug: str):
     """Get a specific paper by its slug."""
     try:
-        paper = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: paper_details_collection.find_one({"slug": paper_slug})
-        )
+        paper = await paper_details_collection.find_one({"slug": paper_slug})
         if paper:
-            return serialize_mongo_doc(paper)
+            # response_cache serializes the raw document
+            return paper
         raise HTTPException(status_code=404, detail="Paper not found")
     except Exception as e:
         raise HTTPException(
@@ -402,22 +698,28 @@ async def get_paper_by_slug(paper_slug: str):
         )
 
 @app.get("/api/papers")
+@response_cache()
 async def get_papers(
+    request: Request,
     category: str = None,
     date: str = None,
     page: int = 1,
     per_page: int = 10,
     sort_by: str = "published_date",
-    sort_order: str = "desc"
+    sort_order: str = "desc",
+    after: str = None,
+    after_id: str = None
 ):
     """
     Fetch papers filtered by category and/or date with pagination and sorting.
-    Returns cached results from MongoDB.
+    Returns cached results from MongoDB. Pass a response's next_cursor as
+    after/after_id to fetch the following page without skipping.
     """
     try:
         # Use today's date if not specified
+        now = datetime.datetime.now(datetime.timezone.utc)
         if not date:
-            date = datetime.datetime.now().strftime("%Y-%m-%d")
+            date = now.astimezone().strftime("%Y-%m-%d")
         
         # Create the query
         query = {"processed_date": date}
@@ -434,33 +736,26 @@ async def get_papers(
             sort_by = "published_date"
         sort_direction = -1 if sort_order.lower() == "desc" else 1
         
-        # Calculate skip for pagination
-        skip = (page - 1) * per_page
+        use_keyset = after is not None and after_id is not None
         
         # Get total count for pagination
-        total_count = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: paper_details_collection.count_documents(query)
-        )
-        
-        # Fetch papers with pagination and sorting
-        papers = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: list(
-                paper_details_collection.find(query)
-                .sort(sort_by, sort_direction)
-                .skip(skip)
-                .limit(per_page)
-            )
-        )
-        
-        # Serialize MongoDB documents
-        serialized_papers = [serialize_mongo_doc(paper) for paper in papers]
-        
+        total_count = await paper_details_collection.count_documents(query)
+        
+        # Fetch papers with pagination and sorting; _id breaks ties in the sort key
+        cursor = paper_details_collection.find(
+            {"$and": [query, keyset_filter(sort_by, sort_direction, after, after_id)]} if use_keyset else query,
+            LIST_PROJECTION
+        ).sort([(sort_by, sort_direction), ("_id", sort_direction)])
+        if not use_keyset:
+            # Calculate skip for pagination
+            cursor = cursor.skip((page - 1) * per_page)
+        papers = await cursor.limit(per_page).to_list(length=per_page)
+        
+        # response_cache serializes the raw documents
         return {
             "date": date,
             "category": category,
-            "papers": serialized_papers,
+            "papers": papers,
             "count": len(papers),
             "total": total_count,
             "page": page,
@@ -468,8 +763,11 @@ async def get_papers(
             "total_pages": (total_count + per_page - 1) // per_page,
             "sort_by": sort_by,
             "sort_order": sort_order,
-            "timestamp": datetime.datetime.utcnow().isoformat()
+            "next_cursor": next_cursor(papers, sort_by, per_page),
+            "timestamp": now.isoformat()
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -477,52 +775,45 @@ async def get_papers(
         )
 
 @app.get("/api/generation-status")
-async def get_generation_status(category: str = None):
+@response_cache(ttl=STATUS_CACHE_TTL_SECONDS)
+async def get_generation_status(request: Request, category: str = None, arxiv_fetcher: ArxivFetcher = Depends(get_arxiv_fetcher)):
     """
     Get the current generation status for all categories or a specific category.
     Returns detailed information about the generation process.
     """
     try:
-        today_date_str = datetime.datetime.now().strftime("%Y-%m-%d")
-        arxiv_fetcher = ArxivFetcher()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        now_iso = now.isoformat()
+        today_date_str = now.astimezone().strftime("%Y-%m-%d")
         
         # If category is specified, only check that category
         categories_to_check = [category] if category else arxiv_fetcher.categories.keys()
         
+        # Today's and all-time paper counts for the checked categories in one round-trip
+        counts = await count_papers_for_status(today_date_str, list(categories_to_check))
+        running = await claimed_categories(today_date_str)
+        
         status_info = {}
         for cat in categories_to_check:
             # Check if generation is in progress
-            is_generating = generation_in_progress.get(cat, False)
+            is_generating = cat in running
             
-            # Check for existing papers today
-            existing_count = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: paper_details_collection.count_documents({
-                    "category_code": cat,
-                    "processed_date": today_date_str
-                })
-            )
-            
-            # Get total papers for this category
-            total_papers = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: paper_details_collection.count_documents({
-                    "category_code": cat
-                })
-            )
+            cat_counts = counts.get(cat, {})
+            existing_count = cat_counts.get("today", 0)
+            total_papers = cat_counts.get("total", 0)
             
             status_info[cat] = {
                 "category_name": arxiv_fetcher.get_category_name(cat),
                 "status": "in_progress" if is_generating else "completed" if existing_count > 0 else "not_started",
                 "papers_generated_today": existing_count,
                 "total_papers": total_papers,
-                "last_updated": datetime.datetime.now().isoformat()
+                "last_updated": now_iso
             }
         
         return {
             "date": today_date_str,
             "status": status_info,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
     except Exception as e:
@@ -534,18 +825,29 @@ async def get_generation_status(category: str = None):
 async def generate_bulk_summaries():
     """Generate 50 summaries for each category."""
     try:
+        await init_database()
         arxiv_fetcher = ArxivFetcher()
         current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        categories = arxiv_fetcher.categories.keys()
+        # Skip categories another run is already generating
+        claims = {}
+        for category in arxiv_fetcher.categories.keys():
+            owner = await claim_generation(category, current_date)
+            if owner is not None:
+                claims[category] = owner
+        categories = list(claims)
         
         print(f"Starting bulk generation of 50 papers for each category...")
         print(f"Total categories to process: {len(categories)}")
         
         results = await run_arxiv_summarizer_async(
             current_date=current_date,
-            categories_to_process=set(categories),
+            categories_to_process=claims,
             api_key=api_key,
-            max_papers_per_category=50
+            max_papers_per_category=50,
+            # Nobody waits on bulk generation, so take the cheaper Batch API
+            use_batch_api=True,
+            arxiv_fetcher=arxiv_fetcher,
+            llm_summarizer=get_llm_summarizer()
         )
         
         print(f"\nBulk generation completed!")
@@ -556,6 +858,138 @@ async def generate_bulk_summaries():
             
     except Exception as e:
         print(f"Error in bulk generation: {str(e)}")
+    finally:
+        # The clients are bound to this event loop; the server runs on a new one
+        await close_http_client()
+        await close_database()
+
+# One arxiv.Client for single-paper lookups, so its HTTP session and request
+# throttling are shared instead of rebuilt per request
+ARXIV_CLIENT = arxiv.Client(page_size=100, delay_seconds=3, num_retries=3)
+ARXIV_CLIENT_SEMAPHORE = asyncio.BoundedSemaphore(4)
+
+# Papers looked up by ID are remembered for a day, so repeated lookups (e.g.
+# PDF analyses while MongoDB is unavailable) don't go back to arXiv
+ARXIV_LOOKUP_TTL_SECONDS = 24 * 60 * 60
+ARXIV_LOOKUP_MAX_ENTRIES = 1024
+_arxiv_lookup_cache: Dict[str, tuple] = {}
+
+async def lookup_arxiv_paper(arxiv_id: str) -> Optional[arxiv.Result]:
+    """Look up a paper by arXiv ID through the shared client; None if arXiv doesn't know it."""
+    now = time.monotonic()
+    entry = _arxiv_lookup_cache.get(arxiv_id)
+    if entry is not None and entry[0] >= now:
+        return entry[1]
+    
+    search = arxiv.Search(id_list=[arxiv_id], max_results=1)
+    async with ARXIV_CLIENT_SEMAPHORE:
+        # The arxiv client is synchronous, so keep its request off the event loop
+        papers = await asyncio.to_thread(lambda: list(ARXIV_CLIENT.results(search)))
+    if not papers:
+        return None
+    
+    if len(_arxiv_lookup_cache) >= ARXIV_LOOKUP_MAX_ENTRIES:
+        # Evict the oldest entry (dicts keep insertion order)
+        _arxiv_lookup_cache.pop(next(iter(_arxiv_lookup_cache)))
+    _arxiv_lookup_cache[arxiv_id] = (now + ARXIV_LOOKUP_TTL_SECONDS, papers[0])
+    return papers[0]
+
+# In-flight single-paper fetches by arXiv ID; concurrent requests for the same
+# paper await one shared task instead of each paying for the summary
+_inflight_papers: Dict[str, asyncio.Task] = {}
+
+async def single_flight_paper(arxiv_id: str, fetch) -> Dict[str, Any]:
+    """
+    Run fetch() once per arxiv_id at a time, sharing its result with every
+    concurrent caller. The task is shielded, so a caller that disconnects
+    doesn't cancel the work for the others.
+    """
+    task = _inflight_papers.get(arxiv_id)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight_papers[arxiv_id] = task
+        task.add_done_callback(lambda _: _inflight_papers.pop(arxiv_id, None))
+    return await asyncio.shield(task)
+
+async def fetch_and_store_paper(arxiv_id: str) -> Dict[str, Any]:
+    """Fetch a paper from arXiv, summarize its abstract and save it."""
+    # Use the arxiv library to fetch the paper
+    print(f"Attempting to search for arxiv paper: {arxiv_id}")
+    
+    paper_obj = await lookup_arxiv_paper(arxiv_id)
+    if paper_obj is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Paper with arXiv ID '{arxiv_id}' not found"
+        )
+    
+    # Shared LLM summarizer
+    llm_summarizer = get_llm_summarizer()
+    
+    # Extract paper information
+    title = paper_obj.title
+    paper_authors = getattr(paper_obj, "authors", None)
+    authors = ", ".join(author.name for author in paper_authors) if paper_authors else "Unknown"
+    url = getattr(paper_obj, "entry_id", None) or f"https://arxiv.org/abs/{arxiv_id}"
+    published = getattr(paper_obj, "published", None)
+    published_date = published.replace(tzinfo=None) if published else datetime.datetime.now()
+    abstract = getattr(paper_obj, "summary", "")
+    
+    # Get paper category (if available)
+    category_code = None
+    paper_categories = getattr(paper_obj, "categories", None)
+    if paper_categories:
+        # categories can be either a list or a string
+        if isinstance(paper_categories, list):
+            categories = paper_categories
+        else:
+            categories = paper_categories.split()
+        # Use the first category as the primary one
+        category_code = categories[0] if categories else None
+    
+    # Generate a slug for the paper
+    slug = slugify(title)
+    
+    # Get the category name
+    category_name = ArxivFetcher.get_category_name(category_code) if category_code else "Uncategorized"
+    category_slug = slugify(category_name)
+    
+    # Generate AI summary using LLM
+    print(f"Generating AI summary for paper: {title}")
+    summary_sections = await llm_summarizer.generate_paper_summary(
+        title=title,
+        authors=authors,
+        abstract=abstract,
+        url=url
+    )
+    
+    # One clock reading for both the generation timestamp and processed_date
+    now = datetime.datetime.now(datetime.timezone.utc)
+    current_date = now.astimezone().strftime("%Y-%m-%d")
+    
+    # Create the paper document
+    paper_doc = {
+        "title": title,
+        "slug": slug,
+        "authors": authors,
+        "category_code": category_code if category_code else "unknown",
+        "category_name": category_name,
+        "category_slug": category_slug,
+        "arxiv_id": arxiv_id,
+        "published_date": published_date,
+        "url": url,
+        "summary_sections": summary_sections,
+        "generation_date": now,
+        "processed_date": current_date,
+        "has_pdf_analysis": False
+    }
+    
+    # Save to MongoDB in one atomic round-trip; if another request stored the
+    # paper meanwhile, keep and return that document
+    paper = await insert_paper_if_absent(paper_doc)
+    invalidate_response_cache()
+    
+    return paper
 
 @app.post("/api/fetch-arxiv-paper")
 async def fetch_arxiv_paper(request: Request):
@@ -575,125 +1009,39 @@ async def fetch_arxiv_paper(request: Request):
             )
         
         # First, check if the paper already exists in our database
-        paper = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: paper_details_collection.find_one({"arxiv_id": arxiv_id})
-        )
+        paper = await paper_details_collection.find_one({"arxiv_id": arxiv_id})
         
         if paper:
             # Paper already exists, return it
-            return serialize_mongo_doc(paper)
+            return json_response(paper)
         
-        # If not in database, fetch the basic info first
-        if not paper:
-            # Fetch the paper directly using arXiv
-            try:
-                # Use the arxiv library to fetch the paper
-                print(f"Attempting to search for arxiv paper: {arxiv_id}")
-                print(f"ArXiv module type: {type(arxiv)}, has Search: {hasattr(arxiv, 'Search')}")
-                
-                # Use the newer Client API instead of deprecated Search.results()
-                client = arxiv.Client()
-                search = arxiv.Search(id_list=[arxiv_id], max_results=1)
-                papers = list(client.results(search))
-                if not papers:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Paper with arXiv ID '{arxiv_id}' not found"
-                    )
-                paper_obj = papers[0]
-                
-                # Initialize LLM summarizer
-                llm_summarizer = LLMSummarizer(api_key=api_key)
-                
-                # Extract paper information
-                title = paper_obj.title
-                authors = ", ".join([str(author) for author in paper_obj.authors]) if hasattr(paper_obj, "authors") and paper_obj.authors else "Unknown"
-                url = paper_obj.entry_id if hasattr(paper_obj, "entry_id") else f"https://arxiv.org/abs/{arxiv_id}"
-                published_date = paper_obj.published.replace(tzinfo=None) if hasattr(paper_obj, "published") else datetime.datetime.now()
-                abstract = paper_obj.summary if hasattr(paper_obj, "summary") else ""
-                
-                # Get paper category (if available)
-                category_code = None
-                if hasattr(paper_obj, 'categories') and paper_obj.categories:
-                    # categories can be either a list or a string
-                    if isinstance(paper_obj.categories, list):
-                        categories = paper_obj.categories
-                    else:
-                        categories = paper_obj.categories.split()
-                    # Use the first category as the primary one
-                    category_code = categories[0] if categories else None
-                
-                # Generate a slug for the paper
-                slug = slugify(title)
-                
-                # Get the category name
-                arxiv_fetcher = ArxivFetcher()
-                category_name = arxiv_fetcher.get_category_name(category_code) if category_code else "Uncategorized"
-                category_slug = slugify(category_name)
-                
-                # Generate AI summary using LLM
-                print(f"Generating AI summary for paper: {title}")
-                summary_sections = await llm_summarizer.generate_paper_summary(
-                    title=title,
-                    authors=authors,
-                    abstract=abstract,
-                    url=url
-                )
-                
-                # Format the current date
-                current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-                
-                # Create the paper document
-                paper_doc = {
-                    "title": title,
-                    "slug": slug,
-                    "authors": authors,
-                    "category_code": category_code if category_code else "unknown",
-                    "category_name": category_name,
-                    "category_slug": category_slug,
-                    "arxiv_id": arxiv_id,
-                    "published_date": published_date,
-                    "url": url,
-                    "summary_sections": summary_sections,
-                    "generation_date": datetime.datetime.now(),
-                    "processed_date": current_date,
-                    "has_pdf_analysis": False
-                }
-                
-                # Save to MongoDB
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: paper_details_collection.insert_one(paper_doc)
-                )
-                
-                paper = serialize_mongo_doc(paper_doc)
-                
-            except HTTPException:
-                raise
-            except Exception as e:
-                print(f"Error fetching paper {arxiv_id}: {str(e)}")
+        # If not in database, fetch it; concurrent requests for the same ID share one fetch
+        try:
+            paper = await single_flight_paper(arxiv_id, lambda: fetch_and_store_paper(arxiv_id))
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"Error fetching paper {arxiv_id}: {str(e)}")
+            
+            # Provide user-friendly error messages
+            if "sequence item" in str(e) and "Author found" in str(e):
+                error_msg = "Failed to process paper authors. The paper data format may have changed."
+            elif "Search" in str(e) and "attribute" in str(e):
+                error_msg = "arXiv library error. Please try again in a moment."
+            elif "not found" in str(e).lower():
+                error_msg = f"Paper with arXiv ID '{arxiv_id}' was not found."
+            elif "connection" in str(e).lower() or "timeout" in str(e).lower():
+                error_msg = "Network connection error. Please check your internet connection and try again."
+            else:
+                error_msg = f"An unexpected error occurred while fetching the paper: {str(e)[:100]}..."
                 
-                # Provide user-friendly error messages
-                if "sequence item" in str(e) and "Author found" in str(e):
-                    error_msg = "Failed to process paper authors. The paper data format may have changed."
-                elif "Search" in str(e) and "attribute" in str(e):
-                    error_msg = "arXiv library error. Please try again in a moment."
-                elif "not found" in str(e).lower():
-                    error_msg = f"Paper with arXiv ID '{arxiv_id}' was not found."
-                elif "connection" in str(e).lower() or "timeout" in str(e).lower():
-                    error_msg = "Network connection error. Please check your internet connection and try again."
-                else:
-                    error_msg = f"An unexpected error occurred while fetching the paper: {str(e)[:100]}..."
-                    
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Error fetching paper: {error_msg}"
-                )
-        else:
-            paper = serialize_mongo_doc(paper)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error fetching paper: {error_msg}"
+            )
             
-        return paper
+        return json_response(paper)
             
     except HTTPException:
         raise
@@ -704,13 +1052,97 @@ async def fetch_arxiv_paper(request: Request):
             detail=f"Unexpected error: {str(e)}"
         )
 
-def download_and_analyze_pdf(arxiv_id: str, save_path: str = None) -> Dict[str, Any]:
+# Concurrent PDF downloads from arxiv.org across pdf-analysis requests
+PDF_DOWNLOAD_SEMAPHORE = asyncio.BoundedSemaphore(5)
+
+# Pages per process-pool task when extracting a PDF for analysis
+PDF_PAGES_PER_TASK = 5
+
+async def extract_pdf_analysis_text(pdf_path: str, max_pages: int = 20, char_budget: int = None):
+    """
+    Extract the text of the first max_pages pages; returns (text, page count).
+    Page ranges are extracted in the shared PDF process pool, each worker
+    opening the file itself. With char_budget, extraction stops once that
+    much text has been collected: the first range runs alone, and the rest
+    are only extracted, in parallel, if it falls short.
+    """
+    num_pages = await asyncio.to_thread(pdf_page_count, pdf_path)
+    
+    # Make sure we actually have pages
+    if num_pages == 0:
+        raise Exception("PDF has no pages")
+    
+    loop = asyncio.get_running_loop()
+    last_page = min(num_pages, max_pages)
+    
+    def extract_range(start):
+        end = min(start + PDF_PAGES_PER_TASK, last_page)
+        return loop.run_in_executor(get_pdf_pool(), extract_pdf_page_range, pdf_path, start, end, char_budget)
+    
+    chunks = [await extract_range(0)]
+    if char_budget is None or sum(len(page_text) for page_text in chunks[0]) < char_budget:
+        chunks += await asyncio.gather(*(
+            extract_range(start) for start in range(PDF_PAGES_PER_TASK, last_page, PDF_PAGES_PER_TASK)
+        ))
+    
+    # Collect the pieces and join once instead of growing a string page by page
+    parts = []
+    total_len = 0
+    for start, chunk in zip(range(0, last_page, PDF_PAGES_PER_TASK), chunks):
+        for page_num, page_text in enumerate(chunk, start):
+            if page_text:
+                header = f"\n--- Page {page_num + 1} ---\n"
+                parts.append(header)
+                parts.append(page_text)
+                total_len += len(header) + len(page_text)
+        # Later ranges were extracted too, but the budget is already spent
+        if char_budget is not None and total_len >= char_budget:
+            break
+    extracted_text = "".join(parts)
+    
+    # If we couldn't extract any text, raise exception
+    if not extracted_text.strip():
+        raise Exception("Could not extract any text from the PDF")
+    
+    return extracted_text, num_pages
+
+# Characters of PDF text sent for summarization; extraction stops once it has them
+PDF_SUMMARY_SAMPLE_CHARS = 10000
+
+# Size of the chunks a PDF download is streamed to disk in
+PDF_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+async def stream_pdf_to_file(response: httpx.Response, save_path: str) -> int:
+    """
+    Write a streamed response body to save_path chunk by chunk, so the whole
+    PDF never sits in memory. The file only appears under save_path once it
+    is complete. Returns the number of bytes written.
+    """
+    partial_path = f"{save_path}.part"
+    size = 0
+    out = await asyncio.to_thread(open, partial_path, "wb")
+    try:
+        async for chunk in response.aiter_bytes(PDF_DOWNLOAD_CHUNK_SIZE):
+            await asyncio.to_thread(out.write, chunk)
+            size += len(chunk)
+    finally:
+        await asyncio.to_thread(out.close)
+    
+    # Check if the content is valid (minimum size check)
+    if size < 1000:  # PDFs are usually larger than 1KB
+        os.remove(partial_path)
+        raise Exception(f"Downloaded content too small ({size} bytes), likely not a valid PDF")
+    os.replace(partial_path, save_path)
+    return size
+
+async def download_and_analyze_pdf(arxiv_id: str, save_path: str = None, char_budget: int = None) -> Dict[str, Any]:
     """
     Download a PDF from arXiv, extract its text, and analyze it.
     
     Args:
         arxiv_id: The arXiv ID of the paper
         save_path: Optional path to save the PDF file
+        char_budget: Optional number of characters after which to stop extracting pages
     
     Returns:
         Dictionary with pdf_path and extracted content
@@ -725,83 +1157,56 @@ def download_and_analyze_pdf(arxiv_id: str, save_path: str = None) -> Dict[str,
             
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
         
-        print(f"Downloading PDF from {pdf_url} to {save_path}")
-        
-        # Download the PDF using a more robust approach
-        try:
+        # Reuse the copy the summarizer saved when it processed this paper
+        # instead of downloading the same PDF again
+        if os.path.exists(save_path) and os.path.getsize(save_path) >= 1000:
+            print(f"Using previously downloaded PDF at {save_path}")
+        else:
+            print(f"Downloading PDF from {pdf_url} to {save_path}")
+            
             # Add request headers to prevent blocking
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             }
             
-            # Create a request with headers
-            req = urllib.request.Request(pdf_url, headers=headers)
-            
             # Download with timeout and retry logic
             max_retries = 3
             retry_delay = 2  # seconds
             
             for attempt in range(max_retries):
                 try:
-                    with urllib.request.urlopen(req, timeout=30) as response:
-                        # Check if the response is actually a PDF (content type)
-                        content_type = response.info().get_content_type()
-                        if 'pdf' not in content_type.lower() and 'application/octet-stream' not in content_type.lower():
-                            print(f"Warning: Expected PDF but got {content_type}")
-                        
-                        # Read the content
-                        pdf_content = response.read()
-                        
-                        # Check if the content is valid (minimum size check)
-                        if len(pdf_content) < 1000:  # PDFs are usually larger than 1KB
-                            raise Exception(f"Downloaded content too small ({len(pdf_content)} bytes), likely not a valid PDF")
-                        
-                        # Save the PDF
-                        with open(save_path, 'wb') as out_file:
-                            out_file.write(pdf_content)
-                        
-                        break  # Success, exit retry loop
-                        
-                except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
+                    async with PDF_DOWNLOAD_SEMAPHORE:
+                        async with get_http_client().stream("GET", pdf_url, headers=headers, timeout=30) as response:
+                            response.raise_for_status()
+                            
+                            # Check if the response is actually a PDF (content type)
+                            content_type = response.headers.get("content-type", "")
+                            if 'pdf' not in content_type.lower() and 'application/octet-stream' not in content_type.lower():
+                                print(f"Warning: Expected PDF but got {content_type}")
+                            
+                            # Stream the PDF straight to disk
+                            await stream_pdf_to_file(response, save_path)
+                    break  # Success, exit retry loop
+                    
+                except httpx.HTTPError as e:
                     if attempt < max_retries - 1:
-                        print(f"Download attempt {attempt+1} failed: {str(e)}. Retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
+                        # Exponential backoff with jitter so concurrent downloads
+                        # don't retry in lockstep; when arXiv rate-limits us, wait
+                        # as long as it asks
+                        delay = retry_delay * 2 ** attempt + random.uniform(0, retry_delay)
+                        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                            retry_after = e.response.headers.get("retry-after", "")
+                            if retry_after.isdigit():
+                                delay = int(retry_after)
+                        print(f"Download attempt {attempt+1} failed: {str(e)}. Retrying in {delay:.1f} seconds...")
+                        await asyncio.sleep(delay)
                     else:
+                        print(f"Download error: {str(e)}")
                         raise Exception(f"Failed to download PDF after {max_retries} attempts: {str(e)}")
-                        
-        except Exception as download_error:
-            print(f"Download error: {str(download_error)}")
-            raise download_error
-            
-        # Extract text from the PDF
-        extracted_text = ""
         
-        # Use PyPDF2 to extract text - with error handling
+        # Extract text from the PDF
         try:
-            with open(save_path, 'rb') as file:
-                reader = PdfReader(file)
-                num_pages = len(reader.pages)
-                
-                # Make sure we actually have pages
-                if num_pages == 0:
-                    raise Exception("PDF has no pages")
-                
-                # Extract text from each page with error handling
-                for page_num in range(min(num_pages, 20)):  # Limit to first 20 pages
-                    try:
-                        page = reader.pages[page_num]
-                        page_text = page.extract_text()
-                        if page_text:
-                            extracted_text += f"\n--- Page {page_num + 1} ---\n"
-                            extracted_text += page_text
-                    except Exception as page_error:
-                        print(f"Error extracting text from page {page_num+1}: {str(page_error)}")
-                        # Continue with other pages
-                
-                # If we couldn't extract any text, raise exception
-                if not extracted_text.strip():
-                    raise Exception("Could not extract any text from the PDF")
-                    
+            extracted_text, num_pages = await extract_pdf_analysis_text(save_path, char_budget=char_budget)
         except Exception as extract_error:
             print(f"PDF extraction error: {str(extract_error)}")
             raise extract_error
@@ -816,26 +1221,68 @@ def download_and_analyze_pdf(arxiv_id: str, save_path: str = None) -> Dict[str,
         print(f"Error downloading or extracting PDF: {str(e)}")
         raise e
 
+# Background MongoDB writes that haven't finished; awaited on shutdown
+_pending_writes: Set[asyncio.Task] = set()
+
+def write_behind(write, error_message: str, after: asyncio.Task = None) -> asyncio.Task:
+    """
+    Run a MongoDB write coroutine in the background, after the write in after
+    (if any) has finished. Errors are logged with error_message; the response
+    cache is invalidated once the write succeeds.
+    """
+    async def persist():
+        if after is not None:
+            await after
+        try:
+            await write
+            invalidate_response_cache()
+        except Exception as e:
+            print(f"{error_message}: {str(e)}")
+    
+    task = asyncio.create_task(persist())
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+    return task
+
+async def flush_pending_writes():
+    """Wait for every background MongoDB write to finish."""
+    if _pending_writes:
+        await asyncio.gather(*_pending_writes)
+
+def discard_task(task: asyncio.Task) -> None:
+    """Cancel a speculative task that is no longer needed, consuming any error it ended with."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
 @app.post("/api/pdf-analysis/{arxiv_id}")
 async def analyze_pdf_by_arxiv_id(arxiv_id: str):
     """
     Download a paper PDF from arXiv, extract its text content,
     summarize it and return the analysis.
     """
+    # One clock reading for every timestamp this request stores
+    now = datetime.datetime.now(datetime.timezone.utc)
+    
+    # The PDF location only depends on the ID, so start downloading and
+    # extracting it while the paper is looked up; dropped if it isn't needed
+    save_path = os.path.join("paper_downloads", f"{arxiv_id}.pdf")
+    pdf_task = asyncio.create_task(
+        download_and_analyze_pdf(arxiv_id, save_path, char_budget=PDF_SUMMARY_SAMPLE_CHARS)
+    )
     try:
         paper_data = None
         use_mongodb = True
+        insert_task = None
         
         # Try to get the paper from MongoDB, fall back to direct arXiv fetch if MongoDB fails
         try:
             # Check if we already have this paper in the database
-            paper = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: paper_details_collection.find_one({"arxiv_id": arxiv_id})
-            )
+            paper = await paper_details_collection.find_one({"arxiv_id": arxiv_id})
             
             if paper:
-                paper_data = serialize_mongo_doc(paper)
+                paper_data = paper
         except Exception as db_error:
             print(f"MongoDB error: {str(db_error)} - Falling back to direct arXiv fetch")
             use_mongodb = False
@@ -848,35 +1295,34 @@ async def analyze_pdf_by_arxiv_id(arxiv_id: str):
                 print(f"Attempting to search for arxiv paper: {arxiv_id}")
                 print(f"ArXiv module type: {type(arxiv)}, has Search: {hasattr(arxiv, 'Search')}")
                 
-                # Use the newer Client API instead of deprecated Search.results()
-                client = arxiv.Client()
-                search = arxiv.Search(id_list=[arxiv_id], max_results=1)
-                papers = list(client.results(search))
-                if not papers:
+                paper_obj = await lookup_arxiv_paper(arxiv_id)
+                if paper_obj is None:
                     raise HTTPException(
                         status_code=404,
                         detail=f"Paper with arXiv ID '{arxiv_id}' not found"
                     )
-                paper_obj = papers[0]
                 
-                # Initialize LLM summarizer
-                llm_summarizer = LLMSummarizer(api_key=api_key)
+                # Shared LLM summarizer
+                llm_summarizer = get_llm_summarizer()
                 
                 # Extract paper information
                 title = paper_obj.title
-                authors = ", ".join([str(author) for author in paper_obj.authors]) if hasattr(paper_obj, "authors") and paper_obj.authors else "Unknown"
-                url = paper_obj.entry_id if hasattr(paper_obj, "entry_id") else f"https://arxiv.org/abs/{arxiv_id}"
-                published_date = paper_obj.published.replace(tzinfo=None) if hasattr(paper_obj, "published") else datetime.datetime.now()
-                abstract = paper_obj.summary if hasattr(paper_obj, "summary") else ""
+                paper_authors = getattr(paper_obj, "authors", None)
+                authors = ", ".join(author.name for author in paper_authors) if paper_authors else "Unknown"
+                url = getattr(paper_obj, "entry_id", None) or f"https://arxiv.org/abs/{arxiv_id}"
+                published = getattr(paper_obj, "published", None)
+                published_date = (published or now).replace(tzinfo=None)
+                abstract = getattr(paper_obj, "summary", "")
                 
                 # Get paper category (if available)
                 category_code = None
-                if hasattr(paper_obj, 'categories') and paper_obj.categories:
+                paper_categories = getattr(paper_obj, "categories", None)
+                if paper_categories:
                     # categories can be either a list or a string
-                    if isinstance(paper_obj.categories, list):
-                        categories = paper_obj.categories
+                    if isinstance(paper_categories, list):
+                        categories = paper_categories
                     else:
-                        categories = paper_obj.categories.split()
+                        categories = paper_categories.split()
                     # Use the first category as the primary one
                     category_code = categories[0] if categories else None
                 
@@ -884,8 +1330,7 @@ async def analyze_pdf_by_arxiv_id(arxiv_id: str):
                 slug = slugify(title)
                 
                 # Get the category name
-                arxiv_fetcher = ArxivFetcher()
-                category_name = arxiv_fetcher.get_category_name(category_code) if category_code else "Uncategorized"
+                category_name = ArxivFetcher.get_category_name(category_code) if category_code else "Uncategorized"
                 category_slug = slugify(category_name)
                 
                 # Generate AI summary using LLM
@@ -897,8 +1342,7 @@ async def analyze_pdf_by_arxiv_id(arxiv_id: str):
                     url=url
                 )
                 
-                # Format the current date
-                current_date = datetime.datetime.now().strftime("%Y-%m-%d")
+                current_date = now.astimezone().strftime("%Y-%m-%d")
                 
                 # Create the paper document
                 paper_doc = {
@@ -912,23 +1356,21 @@ async def analyze_pdf_by_arxiv_id(arxiv_id: str):
                     "published_date": published_date,
                     "url": url,
                     "summary_sections": summary_sections,
-                    "generation_date": datetime.datetime.now(),
+                    "generation_date": now,
                     "processed_date": current_date,
                     "has_pdf_analysis": False
                 }
                 
-                # Save to MongoDB if it's available
+                # Save to MongoDB in the background if it's available; the _id is
+                # set here so the response shows it whenever the write runs
                 if use_mongodb:
-                    try:
-                        await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: paper_details_collection.insert_one(paper_doc)
-                        )
-                    except Exception as save_error:
-                        print(f"Error saving to MongoDB: {str(save_error)}")
-                        # Continue without saving to MongoDB
+                    paper_doc["_id"] = ObjectId()
+                    insert_task = write_behind(
+                        paper_details_collection.insert_one(dict(paper_doc)),
+                        "Error saving to MongoDB"
+                    )
                 
-                paper_data = paper_doc if not use_mongodb else serialize_mongo_doc(paper_doc)
+                paper_data = paper_doc
                 
             except HTTPException:
                 raise
@@ -954,30 +1396,28 @@ async def analyze_pdf_by_arxiv_id(arxiv_id: str):
             
         # Check if we've already analyzed the PDF
         if paper_data.get("pdf_analysis"):
-            return {
+            return json_response({
                 "paper": paper_data,
                 "pdf_analysis": paper_data.get("pdf_analysis")
-            }
+            })
             
-        # Download and extract text from the PDF
-        save_path = os.path.join("paper_downloads", f"{arxiv_id}.pdf")
-        
+        # Wait for the PDF download and text extraction started above
         try:
-            pdf_result = await asyncio.to_thread(download_and_analyze_pdf, arxiv_id, save_path)
+            pdf_result = await pdf_task
         except Exception as pdf_error:
             raise HTTPException(
                 status_code=500,
                 detail=f"Error downloading or analyzing PDF: {str(pdf_error)}"
             )
         
-        # Initialize LLM summarizer
-        llm_summarizer = LLMSummarizer(api_key=api_key)
+        # Shared LLM summarizer
+        llm_summarizer = get_llm_summarizer()
         
         # Generate a summary of the PDF content
         print(f"Generating PDF summary for arXiv ID: {arxiv_id}")
         
         # Extract a subset of the text for summarization (to avoid token limits)
-        extract_text_sample = pdf_result["extracted_text"][:10000]  # First 10K chars
+        extract_text_sample = pdf_result["extracted_text"][:PDF_SUMMARY_SAMPLE_CHARS]
         
         try:
             # Generate summary using the LLM
@@ -997,34 +1437,32 @@ async def analyze_pdf_by_arxiv_id(arxiv_id: str):
             "pdf_path": pdf_result["pdf_path"],
             "num_pages": pdf_result["num_pages"],
             "summary": pdf_summary,
-            "analysis_date": datetime.datetime.now().isoformat()
+            "analysis_date": now.isoformat()
         }
         
-        # Update the paper document with the PDF analysis if MongoDB is available
+        # Update the paper document with the PDF analysis in the background if
+        # MongoDB is available; the response below already carries the analysis
         if use_mongodb:
-            try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: paper_details_collection.update_one(
-                        {"arxiv_id": arxiv_id},
-                        {"$set": {
-                            "pdf_analysis": pdf_analysis,
-                            "has_pdf_analysis": True
-                        }}
-                    )
-                )
-            except Exception as update_error:
-                print(f"Error updating MongoDB: {str(update_error)}")
-                # Continue without updating MongoDB
+            write_behind(
+                paper_details_collection.update_one(
+                    {"arxiv_id": arxiv_id},
+                    {"$set": {
+                        "pdf_analysis": pdf_analysis,
+                        "has_pdf_analysis": True
+                    }}
+                ),
+                "Error updating MongoDB",
+                after=insert_task
+            )
         
         # Update the paper object with the PDF analysis
         paper_data["pdf_analysis"] = pdf_analysis
         paper_data["has_pdf_analysis"] = True
         
-        return {
+        return json_response({
             "paper": paper_data,
             "pdf_analysis": pdf_analysis
-        }
+        })
         
     except HTTPException:
         raise
@@ -1047,6 +1485,8 @@ async def analyze_pdf_by_arxiv_id(arxiv_id: str):
             status_code=500,
             detail=f"Error analyzing PDF: {error_msg}"
         )
+    finally:
+        discard_task(pdf_task)
 
 def main():
     """Command line interface for the arXiv summarizer."""
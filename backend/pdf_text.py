@@ -0,0 +1,64 @@
+from typing import Any, List, Optional
+import pymupdf
+
+# Kept free of the app's other imports: PDF worker processes import this
+# module on their own to run extract_pdf_pages
+
+# Plain-text extraction flags: keep whitespace and clip to the page, but expand
+# ligatures rather than preserving them and skip images entirely. Spaces are
+# not inhibited, since the LLM needs word boundaries
+TEXT_FLAGS = pymupdf.TEXT_PRESERVE_WHITESPACE | pymupdf.TEXT_MEDIABOX_CLIP
+
+def open_pdf(pdf_input: Any) -> pymupdf.Document:
+    """Open a PDF given as a path or as bytes."""
+    if isinstance(pdf_input, (bytes, bytearray)):
+        return pymupdf.open(stream=pdf_input, filetype="pdf")
+    return pymupdf.open(pdf_input)
+
+def extract_pdf_pages(pdf_input: Any, max_pages: int = 5, max_chars: Optional[int] = None) -> str:
+    """
+    Extract the text of the first max_pages pages of a PDF (path or bytes) with
+    PyMuPDF, stopping early once max_chars characters have been collected.
+    """
+    with open_pdf(pdf_input) as doc:
+        # Encrypted and empty documents have no text we can read
+        if doc.needs_pass or doc.page_count == 0:
+            return ""
+        text_content = []
+        total_len = 0
+        for i in range(min(max_pages, doc.page_count)):
+            page_text = doc[i].get_text("text", flags=TEXT_FLAGS, sort=False)
+            # No text layer on the first page usually means a scanned PDF; don't
+            # walk the remaining pages for nothing
+            if i == 0 and not page_text.strip():
+                return ""
+            text_content.append(page_text)
+            total_len += len(page_text)
+            if max_chars is not None and total_len >= max_chars:
+                break
+        return "\n".join(text_content)
+
+def pdf_page_count(pdf_input: Any) -> int:
+    """Number of pages in a PDF (path or bytes)."""
+    with open_pdf(pdf_input) as doc:
+        return doc.page_count
+
+def extract_pdf_page_range(pdf_input: Any, start: int, end: int, max_chars: Optional[int] = None) -> List[str]:
+    """
+    Extract the text of pages [start, end) of a PDF (path or bytes), one
+    string per page, stopping early once max_chars characters have been
+    collected. A page that fails to extract comes back empty.
+    """
+    page_texts = []
+    total_len = 0
+    with open_pdf(pdf_input) as doc:
+        for page_num in range(start, min(end, doc.page_count)):
+            try:
+                page_texts.append(doc[page_num].get_text("text", flags=TEXT_FLAGS, sort=False))
+            except Exception as page_error:
+                print(f"Error extracting text from page {page_num+1}: {str(page_error)}")
+                page_texts.append("")
+            total_len += len(page_texts[-1])
+            if max_chars is not None and total_len >= max_chars:
+                break
+    return page_texts